@@ -3,6 +3,7 @@ from .triage_agent import TriageAgent
 from .priority_agent import PriorityAgent
 from .explainer_agent import ExplainerAgent
 from .confidence_agent import ConfidenceAgent
+from .explainer_confidence_agent import ExplainerConfidenceAgent
 from .sla_mapper_agent import SLAMapperAgent, SLAResult
 from .priority_calculator_agent import PriorityCalculatorAgent, PriorityResult
 from .vendor_matching_agent import VendorMatchingAgent
@@ -13,6 +14,7 @@ __all__ = [
     "PriorityAgent",
     "ExplainerAgent",
     "ConfidenceAgent",
+    "ExplainerConfidenceAgent",
     "SLAMapperAgent",
     "SLAResult",
     "PriorityCalculatorAgent",
@@ -3,9 +3,200 @@ Base Agent Class
 Provides common functionality for all agents in the pipeline.
 """
 
+import asyncio
+import hashlib
+import json
+import os
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
-from agents import Agent, Runner
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import httpx
+from agents import Agent, ModelSettings, Runner, set_default_openai_client
+from openai import AsyncOpenAI
+from openai.types.responses import ResponseTextDeltaEvent
+
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib encoder
+    orjson = None
+
+try:
+    import tiktoken
+except ImportError:  # optional; token counts fall back to a length estimate
+    tiktoken = None
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+
+# Exact-match response cache shared by every agent instance (and so across warm
+# Lambda invocations). Keyed by model, system prompt and input; a hit skips the
+# LLM round trip entirely. Off unless AGENT_RESPONSE_CACHE is set or an agent
+# is built with cache_responses=True. Entries expire after
+# AGENT_RESPONSE_CACHE_TTL seconds and hold only the output text.
+RESPONSE_CACHE_ENABLED = os.getenv("AGENT_RESPONSE_CACHE", "false").lower() in ("1", "true", "yes")
+RESPONSE_CACHE_SIZE = int(os.getenv("AGENT_RESPONSE_CACHE_SIZE", "256"))
+RESPONSE_CACHE_TTL = float(os.getenv("AGENT_RESPONSE_CACHE_TTL", "300"))
+_RESPONSE_CACHE: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+
+@dataclass(slots=True, frozen=True)
+class CachedResult:
+    """Stand-in for the SDK RunResult when a response comes from the cache."""
+    final_output: Any
+
+    def __str__(self) -> str:
+        return str(self.final_output)
+
+
+def clear_response_cache() -> None:
+    """Drop all cached agent responses."""
+    _RESPONSE_CACHE.clear()
+
+
+def _get_cached_response(key: str) -> Optional[CachedResult]:
+    """Return the cached response for key, dropping it if it has expired."""
+    entry = _RESPONSE_CACHE.get(key)
+    if entry is None:
+        return None
+    expires_at, final_output = entry
+    if expires_at <= time.monotonic():
+        del _RESPONSE_CACHE[key]
+        return None
+    _RESPONSE_CACHE.move_to_end(key)
+    return CachedResult(final_output=final_output)
+
+
+def _cache_response(key: str, result: Any) -> None:
+    """Store a run's final output (not the whole RunResult) under key."""
+    _RESPONSE_CACHE[key] = (time.monotonic() + RESPONSE_CACHE_TTL, result.final_output)
+    _RESPONSE_CACHE.move_to_end(key)
+    if len(_RESPONSE_CACHE) > RESPONSE_CACHE_SIZE:
+        _RESPONSE_CACHE.popitem(last=False)
+
+
+# Print how much of each LLM call's input was served from the provider's
+# prompt cache, to check that the static prefix is actually being reused
+LOG_PROMPT_CACHE = os.getenv("LOG_PROMPT_CACHE", "false").lower() in ("1", "true", "yes")
+
+
+def cached_input_tokens(result: Any) -> Optional[Tuple[int, int]]:
+    """
+    Read prompt cache usage from a run result.
+    
+    Returns:
+        (cached_tokens, input_tokens), or None if the result has no usage
+        (e.g. fast-path results).
+    """
+    usage = getattr(getattr(result, "context_wrapper", None), "usage", None)
+    if usage is None:
+        return None
+    details = getattr(usage, "input_tokens_details", None)
+    return getattr(details, "cached_tokens", 0) or 0, usage.input_tokens
+
+
+# Event loop the shared OpenAI client's connection pool belongs to
+_SHARED_CLIENT_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def use_shared_openai_client() -> None:
+    """
+    Install one pooled keep-alive OpenAI client as the SDK default.
+    
+    Every agent call on the running event loop then reuses warm TCP/TLS
+    connections instead of handshaking per request. httpx pools are bound to
+    the loop that opened them, so a new client is installed whenever the
+    running loop changes (e.g. one asyncio.run per Lambda invocation).
+    Must be called from a coroutine.
+    """
+    global _SHARED_CLIENT_LOOP
+    loop = asyncio.get_running_loop()
+    if loop is _SHARED_CLIENT_LOOP:
+        return
+    http_client = httpx.AsyncClient(
+        http2=_HTTP2_AVAILABLE,
+        limits=httpx.Limits(
+            max_connections=100, max_keepalive_connections=50, keepalive_expiry=60
+        ),
+        # Reasoning models can take minutes; only connecting is kept short
+        timeout=httpx.Timeout(600.0, connect=5.0),
+    )
+    set_default_openai_client(AsyncOpenAI(http_client=http_client))
+    _SHARED_CLIENT_LOOP = loop
+
+
+# tiktoken encodings by model (None when unavailable), loaded on first use
+_ENCODINGS: Dict[str, Any] = {}
+
+
+def _encoding_for(model: str) -> Any:
+    """Return the tiktoken encoding for a model, or None if it cannot be loaded."""
+    if model not in _ENCODINGS:
+        encoding = None
+        if tiktoken is not None:
+            try:
+                encoding = tiktoken.encoding_for_model(model)
+            except KeyError:  # model newer than the installed tiktoken
+                encoding = tiktoken.get_encoding("o200k_base")
+            except Exception:  # BPE file could not be fetched
+                encoding = None
+        _ENCODINGS[model] = encoding
+    return _ENCODINGS[model]
+
+
+def count_tokens(text: str, model: str = "gpt-5-mini") -> int:
+    """
+    Count the tokens a model would see for text.
+    
+    Exact with tiktoken installed; otherwise estimated at ~4 characters per
+    token, which is close for English and JSON.
+    """
+    encoding = _encoding_for(model)
+    if encoding is None:
+        return (len(text) + 3) // 4
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+# System prompts are static, so their digest and token count are computed once
+# per prompt text (an edited prompt is simply a new key)
+_PROMPT_DIGESTS: Dict[str, str] = {}
+_PROMPT_TOKEN_COUNTS: Dict[Tuple[str, str], int] = {}
+
+
+# SDK Agent objects by (name, model, system prompt digest). They hold only static
+# configuration, so every BaseAgent instance with the same setup shares one
+_SDK_AGENTS: Dict[Tuple[str, str, str], Agent] = {}
+
+
+def _prompt_digest(prompt: str) -> str:
+    """Return the sha256 hex digest of a system prompt, hashing it only once."""
+    digest = _PROMPT_DIGESTS.get(prompt)
+    if digest is None:
+        digest = _PROMPT_DIGESTS[prompt] = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+    return digest
+
+
+def dumps_json(payload: Any) -> str:
+    """
+    Serialize a prompt payload as compact JSON with sorted keys.
+    
+    Uses orjson when installed (C-backed, several times faster on nested
+    request dicts) and the stdlib otherwise; both produce the same text.
+    Compact output also sends fewer tokens than indented JSON.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            payload, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str
+        ).decode("utf-8")
+    return json.dumps(
+        payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    )
 
 
 class BaseAgent(ABC):
@@ -15,11 +206,16 @@ class BaseAgent(ABC):
         self,
         name: str,
         model: str = "gpt-5-mini",
-        temperature: float = 0.2
+        temperature: float = 0.2,
+        cache_responses: Optional[bool] = None
     ):
         self.name = name
         self.model = model
         self.temperature = temperature
+        # None follows AGENT_RESPONSE_CACHE (off by default)
+        self.cache_responses = (
+            RESPONSE_CACHE_ENABLED if cache_responses is None else cache_responses
+        )
         self._agent: Optional[Agent] = None
     
     @property
@@ -28,28 +224,145 @@ class BaseAgent(ABC):
         """Return the system prompt for this agent."""
         pass
     
+    @property
+    def prompt_cache_key(self) -> str:
+        """
+        Stable key for provider-side prompt (prefix) caching.
+        
+        Requests sharing a key are routed to the same cache, so the static system
+        prompt is prefilled once instead of billed as fresh input every call.
+        The key embeds a hash of the prompt text, so editing a prompt starts a
+        new cache without manual versioning.
+        """
+        digest = _prompt_digest(self.system_prompt)[:12]
+        return f"rentmatrix-{self.__class__.__name__}-{digest}"
+    
+    @property
+    def system_prompt_tokens(self) -> int:
+        """
+        Token count of the system prompt for this agent's model.
+        
+        Encoded once per prompt text and model, so prompt budgets can include
+        it on every request without re-tokenizing the static instructions.
+        """
+        key = (self.model, self.system_prompt)
+        count = _PROMPT_TOKEN_COUNTS.get(key)
+        if count is None:
+            count = _PROMPT_TOKEN_COUNTS[key] = count_tokens(self.system_prompt, self.model)
+        return count
+    
     @property
     def agent(self) -> Agent:
-        """Lazy initialization of the Agent instance."""
+        """
+        Lazy initialization of the Agent instance.
+        
+        Built once per name/model/system prompt and shared, so agents created
+        per request (e.g. in request handlers) reuse the same SDK object.
+        """
         if self._agent is None:
-            self._agent = Agent(
-                name=self.name,
-                model=self.model,
-                instructions=self.system_prompt,
-            )
+            key = (self.name, self.model, _prompt_digest(self.system_prompt))
+            agent = _SDK_AGENTS.get(key)
+            if agent is None:
+                # The system prompt holds only static instructions; all per-request
+                # data goes in the user message so the cached prefix stays identical.
+                agent = _SDK_AGENTS[key] = Agent(
+                    name=self.name,
+                    model=self.model,
+                    instructions=self.system_prompt,
+                    model_settings=ModelSettings(
+                        extra_args={"prompt_cache_key": self.prompt_cache_key}
+                    ),
+                )
+            self._agent = agent
         return self._agent
     
-    async def run(self, input_prompt: str) -> Any:
+    def _log_prompt_cache(self, result: Any) -> None:
+        """Print the prompt cache hit for a fresh LLM call when LOG_PROMPT_CACHE is set."""
+        if not LOG_PROMPT_CACHE:
+            return
+        usage = cached_input_tokens(result)
+        if usage is not None:
+            cached, total = usage
+            print(f"[{self.name}] prompt cache: {cached}/{total} input tokens cached")
+    
+    def _response_cache_key(self, cache_input: str) -> str:
+        """Hash the model, system prompt digest and input into a response cache key."""
+        payload = "\x00".join((self.model, _prompt_digest(self.system_prompt), cache_input))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    async def run(self, input_prompt: str, cache_key: Optional[str] = None) -> Any:
         """
         Execute the agent with the given input.
         
+        When response caching is on, identical calls within the TTL are
+        answered from the shared cache as a CachedResult.
+        
         Args:
             input_prompt: The input prompt for the agent.
+            cache_key: Canonical form of the input to cache on, for prompts that
+                embed volatile fields (ids, timestamps). Defaults to the prompt.
             
         Returns:
             The agent's response.
         """
+        use_shared_openai_client()
+        if not self.cache_responses or RESPONSE_CACHE_SIZE <= 0:
+            result = await Runner.run(self.agent, input=input_prompt)
+            self._log_prompt_cache(result)
+            return result
+        
+        key = self._response_cache_key(input_prompt if cache_key is None else cache_key)
+        cached = _get_cached_response(key)
+        if cached is not None:
+            return cached
+        
         result = await Runner.run(self.agent, input=input_prompt)
+        self._log_prompt_cache(result)
+        _cache_response(key, result)
+        return result
+    
+    async def run_streamed(
+        self,
+        input_prompt: str,
+        on_delta: Optional[Callable[[str], None]] = None,
+        cache_key: Optional[str] = None
+    ) -> Any:
+        """
+        Execute the agent, passing output text to on_delta as tokens arrive.
+        
+        Lets callers render a long response while it is still being generated
+        instead of after the full completion. Shares the response cache with
+        run(); a cache hit is delivered to on_delta in one piece.
+        
+        Args:
+            input_prompt: The input prompt for the agent.
+            on_delta: Called with each chunk of output text.
+            cache_key: Canonical form of the input to cache on (see run()).
+            
+        Returns:
+            The completed run (final_output holds the full text).
+        """
+        use_shared_openai_client()
+        use_cache = self.cache_responses and RESPONSE_CACHE_SIZE > 0
+        key = None
+        if use_cache:
+            key = self._response_cache_key(input_prompt if cache_key is None else cache_key)
+            cached = _get_cached_response(key)
+            if cached is not None:
+                if on_delta is not None:
+                    on_delta(str(cached.final_output))
+                return cached
+        
+        result = Runner.run_streamed(self.agent, input=input_prompt)
+        async for event in result.stream_events():
+            if on_delta is None or event.type != "raw_response_event":
+                continue
+            if isinstance(event.data, ResponseTextDeltaEvent):
+                on_delta(event.data.delta)
+        self._log_prompt_cache(result)
+        
+        if use_cache:
+            _cache_response(key, result)
         return result
     
     def build_prompt(self, **kwargs) -> str:
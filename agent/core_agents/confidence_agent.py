@@ -3,11 +3,22 @@ Agent 4: Confidence Evaluator Agent
 Evaluates confidence in the triage and priority classification decisions.
 """
 
-from typing import Any, Dict
+import json
+import os
+from typing import Any, Dict, Optional
 from .base_agent import BaseAgent
+from .triage_fast_path import FastPathResult
 from ..prompts import SYSTEM_PROMPT_CONFIDENCE
 
 
+# Triage confidence at or above which a clear-cut severity skips the LLM call
+CONF_SHORTCIRCUIT_THRESHOLD = float(os.getenv("CONF_SHORTCIRCUIT_THRESHOLD", "0.92"))
+
+# "on": answer confident clear-cut cases locally. "shadow": still call the LLM,
+# log both results for comparison and return the LLM's. "off": always call the LLM.
+CONF_SHORTCIRCUIT_MODE = os.getenv("CONF_SHORTCIRCUIT", "on").lower()
+
+
 class ConfidenceAgent(BaseAgent):
     """
     Confidence Evaluator Agent
@@ -22,8 +33,19 @@ class ConfidenceAgent(BaseAgent):
     - routing: AUTO_APPROVE | PM_REVIEW_QUEUE | PM_IMMEDIATE_REVIEW
     - confidence_factors: List of factors affecting confidence
     - risk_flags: List of identified risk factors
+    
+    Confident EMERGENCY/LOW triage results from the Triage Agent are answered
+    from the triage confidence without a second LLM call. Fast-path results
+    always get the full evaluation.
     """
     
+    # Severities the evaluator almost always confirms when triage is confident
+    CLEAR_SEVERITIES = frozenset({"EMERGENCY", "LOW"})
+    
+    # Ceiling on provisional confidence for fast-path triage results; keyword
+    # matches are never auto-approved without the full evaluation
+    FAST_PATH_CONFIDENCE_CAP = 0.89
+    
     def __init__(self, model: str = "gpt-5-mini"):
         super().__init__(
             name="Confidence Evaluator Agent",
@@ -35,6 +57,127 @@ class ConfidenceAgent(BaseAgent):
     def system_prompt(self) -> str:
         return SYSTEM_PROMPT_CONFIDENCE
     
+    async def run(
+        self,
+        input_prompt: str,
+        cache_key: Optional[str] = None,
+        triage_parsed: Optional[Dict[str, Any]] = None,
+        fast_path: bool = False
+    ) -> Any:
+        """
+        Evaluate confidence, skipping the LLM when triage is already unambiguous.
+        
+        Args:
+            input_prompt: The prompt from build_prompt().
+            cache_key: Optional response cache key.
+            triage_parsed: Parsed Triage Agent output; enables the short-circuit.
+            fast_path: Whether the triage result came from the triage fast path
+                (such results always get the full evaluation).
+            
+        Returns:
+            The agent's response (a FastPathResult when short-circuited).
+        """
+        mode = CONF_SHORTCIRCUIT_MODE
+        shortcut = None
+        if mode in ("on", "shadow"):
+            shortcut = self.shortcut(triage_parsed, fast_path=fast_path)
+        if shortcut is not None and mode == "on":
+            return FastPathResult(final_output=json.dumps(shortcut, indent=2))
+        
+        result = await super().run(input_prompt, cache_key=cache_key)
+        if shortcut is not None:
+            print(f"[confidence shortcut shadow] shortcut={json.dumps(shortcut)} llm={result.final_output}")
+        return result
+    
+    def shortcut(
+        self,
+        triage_parsed: Optional[Dict[str, Any]],
+        fast_path: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Build the confidence output locally for unambiguous triage results.
+        
+        Args:
+            triage_parsed: Parsed Triage Agent output.
+            fast_path: Whether the triage result came from the triage fast path.
+                Its confidence is a fixed keyword score, not a model estimate,
+                so fast-path results are never short-circuited.
+            
+        Returns:
+            Output in the Confidence Agent's JSON shape, or None when the
+            request needs the LLM evaluation.
+        """
+        if fast_path or not isinstance(triage_parsed, dict):
+            return None
+        severity = triage_parsed.get("severity")
+        
+        confidence = triage_parsed.get("confidence")
+        if not isinstance(confidence, (int, float)) or isinstance(confidence, bool):
+            return None
+        if severity not in self.CLEAR_SEVERITIES or confidence < CONF_SHORTCIRCUIT_THRESHOLD:
+            return None
+        confidence = min(float(confidence), 1.0)
+        reason = f"Triage confidence {confidence:.2f} on a clear-cut {severity} case"
+        
+        routing = self._routing_for(confidence, severity)
+        return {
+            "confidence": confidence,
+            "routing": routing,
+            "confidence_factors": [
+                {"factor": "triage_confidence", "impact": "POSITIVE", "points": 0.0, "reason": reason}
+            ],
+            "risk_flags": [],
+            "recommendation": f"{reason}; evaluator skipped. Routed {routing}."
+        }
+    
+    def provisional(
+        self,
+        triage_parsed: Optional[Dict[str, Any]],
+        fast_path: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Confidence output from the triage result alone, for use while the full
+        evaluation is still running.
+        
+        Args:
+            triage_parsed: Parsed Triage Agent output.
+            fast_path: Whether the triage result came from the triage fast path;
+                its confidence is capped at FAST_PATH_CONFIDENCE_CAP.
+            
+        Returns:
+            Output in the Confidence Agent's JSON shape, flagged
+            "evaluation_pending" unless the short-circuit already applies.
+        """
+        shortcut = self.shortcut(triage_parsed, fast_path=fast_path)
+        if shortcut is not None:
+            return shortcut
+        
+        triage_parsed = triage_parsed if isinstance(triage_parsed, dict) else {}
+        severity = triage_parsed.get("severity")
+        confidence = triage_parsed.get("confidence")
+        if not isinstance(confidence, (int, float)) or isinstance(confidence, bool):
+            confidence = 0.0
+        confidence = min(float(confidence), 1.0)
+        if fast_path:
+            confidence = min(confidence, self.FAST_PATH_CONFIDENCE_CAP)
+        routing = self._routing_for(confidence, severity)
+        return {
+            "confidence": confidence,
+            "routing": routing,
+            "confidence_factors": [],
+            "risk_flags": ["evaluation_pending"],
+            "recommendation": f"Provisional: triage confidence only, full evaluation pending. Routed {routing}."
+        }
+    
+    @staticmethod
+    def _routing_for(confidence: float, severity: Optional[str]) -> str:
+        """Apply the system prompt's routing bands and EMERGENCY review rule."""
+        if confidence < 0.70:
+            return "PM_IMMEDIATE_REVIEW"
+        if confidence < 0.90 or (severity == "EMERGENCY" and confidence < 0.95):
+            return "PM_REVIEW_QUEUE"
+        return "AUTO_APPROVE"
+    
     def build_prompt(
         self,
         triage_output: str,
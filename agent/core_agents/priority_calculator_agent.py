@@ -4,12 +4,124 @@ Calculates numerical priority score using hazard-based multiplicative model.
 No LLM required - pure mathematical calculation.
 """
 
+import hashlib
+import json
+import math
 import re
-from typing import Dict, Any, List, Optional, Tuple
+from collections import OrderedDict
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from dataclasses import dataclass, field
 
 
-@dataclass
+def _compile_literal_scanner(
+    keywords: Dict[str, Tuple[str, ...]]
+) -> Tuple["re.Pattern[str]", Dict[str, frozenset]]:
+    """
+    Build one regex that finds every keyword literal in a single pass.
+    
+    The alternation sits inside a lookahead so overlapping hits are reported,
+    and longer literals are tried first. Each literal also credits the keys
+    of any shorter literal it contains, so the scan finds the same keys as
+    testing every literal on its own.
+    """
+    literal_keys: Dict[str, set] = {}
+    for key, literals in keywords.items():
+        for literal in literals:
+            literal_keys.setdefault(literal, set()).add(key)
+    
+    credited = {
+        literal: frozenset().union(
+            *(keys for other, keys in literal_keys.items() if other in literal)
+        )
+        for literal in literal_keys
+    }
+    alternation = "|".join(
+        re.escape(literal) for literal in sorted(literal_keys, key=len, reverse=True)
+    )
+    return re.compile(f"(?=({alternation}))"), credited
+
+
+_LEADING_LITERAL = re.compile(r"(\\b)?([a-z0-9']*)(.?)")
+
+
+def _literal_prefilter(pattern: str) -> Tuple[str, Optional["re.Pattern[str]"]]:
+    """
+    Split a keyword pattern into a required literal and the regex still needed.
+    
+    The literal is the run of plain characters the pattern starts with, so it
+    must occur in any matching text; a C-level substring test rejects most
+    texts before the regex engine runs. Patterns that are nothing but that
+    literal need no regex at all.
+    """
+    boundary, literal, following = _LEADING_LITERAL.match(pattern).groups()
+    if not boundary and literal == pattern:
+        return literal, None
+    if following in ("?", "*", "{"):
+        # The quantifier makes the last character optional
+        literal = literal[:-1]
+    return literal, re.compile(pattern)
+
+
+def _hazard_kernel(base_hazard: float, ratios: Iterable[float]) -> float:
+    """
+    Numeric core of the model: h = base_hazard × ∏(ratios).
+    
+    Ratios are multiplied left to right (math.prod runs the loop in C), so the
+    result matches the step-by-step values shown in the calculation trace.
+    """
+    return math.prod(ratios, start=base_hazard)
+
+
+def _as_number(value: Any, default: float) -> float:
+    """Coerce a context value to int/float, keeping ints as-is (they appear in reasons)."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _as_int(value: Any, default: Optional[int]) -> Optional[int]:
+    """Coerce a context value to int, falling back to default when missing or invalid."""
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return default
+
+
+def _confidence_kernel(n_factors: int, is_extreme: bool, desc_len: int) -> float:
+    """
+    Numeric core of the confidence estimate, over precomputed counts only.
+    
+    Base 0.85; +0.05 for 3+ factors, -0.10 for none; +0.05 for an extreme
+    severity (EMERGENCY/LOW); +0.05 for a detailed (>100 chars) description,
+    -0.10 for a very short (<20 chars) one. Clamped to [0.5, 1.0].
+    """
+    confidence = 0.85  # Base confidence for deterministic calculation
+    
+    # More factors = more confidence (clear signals)
+    if n_factors >= 3:
+        confidence += 0.05
+    elif n_factors == 0:
+        confidence -= 0.10
+    
+    # Clear severity indicators
+    if is_extreme:
+        confidence += 0.05  # Clear extremes
+    
+    # Description length affects confidence
+    if desc_len > 100:
+        confidence += 0.05  # Detailed description
+    elif desc_len < 20:
+        confidence -= 0.10  # Too short
+    
+    return max(0.5, min(1.0, confidence))
+
+
+@dataclass(slots=True, frozen=True)
 class PriorityFactor:
     """A factor that affects priority score."""
     name: str
@@ -18,7 +130,7 @@ class PriorityFactor:
     category: str  # LIFE_SAFETY, ACTIVE_DAMAGE, VULNERABILITY, etc.
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InteractionEffect:
     """An interaction effect between multiple factors."""
     name: str
@@ -26,7 +138,92 @@ class InteractionEffect:
     trigger: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class _Ctx:
+    """Request inputs normalized once per calculation (read by every _apply_* helper)."""
+    description: str  # lowercased
+    trade: str  # uppercased
+    kf_hits: frozenset  # KEY_FACTOR_KEYWORDS keys found in the lowercased key_factors
+    temp: float
+    has_medical: bool
+    has_infant: bool
+    is_elderly: bool
+    age: int
+    is_pregnant: bool
+    is_late_night: bool
+    is_holiday: bool
+    is_after_hours: bool
+    is_weekend: bool
+    recent_count: int
+    previous_repair_failed: bool
+    floor: Optional[int]
+    total_units: int
+    
+    @classmethod
+    def from_request(
+        cls, request_data: Dict[str, Any], trade: str, kf_hits: frozenset
+    ) -> "_Ctx":
+        """
+        Extract and validate every value used by the calculator in one pass.
+        
+        Values are coerced to their field types here, so the helpers read plain
+        attributes. Missing sections and explicit nulls fall back to the defaults.
+        All case folding happens here too; the helpers never call lower().
+        """
+        request = request_data.get("request") or {}
+        description = (request.get("description") or "").lower()
+        context = request_data.get("context") or {}
+        weather = context.get("weather") or {}
+        tenant = context.get("tenant") or {}
+        property_info = context.get("property") or {}
+        timing = context.get("timing") or {}
+        history = context.get("history") or {}
+        floor = property_info.get("floor")
+        return cls(
+            description=description,
+            trade=trade,
+            kf_hits=kf_hits,
+            temp=_as_number(weather.get("temperature"), 70),
+            has_medical=bool(tenant.get("has_medical_condition")),
+            has_infant=bool(tenant.get("has_infant")),
+            is_elderly=bool(tenant.get("is_elderly")),
+            age=_as_int(tenant.get("age"), 0),
+            is_pregnant=bool(tenant.get("is_pregnant")),
+            is_late_night=bool(timing.get("is_late_night")),
+            is_holiday=bool(timing.get("is_holiday")),
+            is_after_hours=bool(timing.get("is_after_hours")),
+            is_weekend=bool(timing.get("is_weekend")),
+            recent_count=_as_int(history.get("recent_issues_count"), 0),
+            previous_repair_failed=bool(history.get("previous_repair_failed")),
+            floor=None if floor is None else _as_int(floor, None),
+            total_units=_as_int(property_info.get("total_units"), 1),
+        )
+
+
+@dataclass(slots=True)
+class _FactorState:
+    """Running summary of fired factors, updated as each _apply_* step reports."""
+    fired: List[str] = field(default_factory=list)
+    categories: set = field(default_factory=set)
+    has_water: bool = False
+    has_electrical: bool = False
+    has_spreading: bool = False
+    vulnerability_count: int = 0
+    
+    def add(self, factor_ids: List[str], traits: Dict[str, Tuple[str, bool, bool, bool]]) -> None:
+        """Record newly fired factor ids using their precomputed traits."""
+        for fid in factor_ids:
+            category, is_water, is_electrical, is_spreading = traits[fid]
+            self.fired.append(fid)
+            self.categories.add(category)
+            self.has_water |= is_water
+            self.has_electrical |= is_electrical
+            self.has_spreading |= is_spreading
+            if category == "VULNERABILITY":
+                self.vulnerability_count += 1
+
+
+@dataclass(slots=True, frozen=True)
 class PriorityResult:
     """Result from priority calculation."""
     priority_score: float
@@ -87,7 +284,12 @@ class PriorityCalculatorAgent:
         "EMERGENCY": 5.667
     }
     
-    # Keyword patterns for detecting factors from description
+    # Severity groups tested on every request (hashed membership, not list scans)
+    CLEAR_SEVERITIES = frozenset({"EMERGENCY", "LOW"})
+    RECURRENCE_SEVERITIES = frozenset({"HIGH", "EMERGENCY"})
+    
+    # Keyword patterns for detecting factors from description.
+    # Authored lowercase: they only ever run against the lowercased description.
     KEYWORD_PATTERNS = {
         "gas_leak": [r'\bgas\b', r'gas\s*leak', r'gas\s*smell', r'natural\s*gas'],
         "fire_smoke": [r'\bfire\b', r'\bflames?\b', r'\bsmoke\b', r'\bburning\b'],
@@ -108,10 +310,139 @@ class PriorityCalculatorAgent:
         "third_time": [r'third\s*time', r'3rd\s*time', r'keeps\s*happening', r'happened\s*(again|before)'],
         "repair_failed": [r'still\s*not\s*fixed', r"didn'?t\s*work", r'repair.*failed', r'came\s*back'],
     }
+    # Compiled once, without re.IGNORECASE (no per-character case folding), each
+    # paired with the literal it must contain as a substring prefilter
+    _COMPILED_PATTERNS = {
+        key: tuple(_literal_prefilter(pattern) for pattern in patterns)
+        for key, patterns in KEYWORD_PATTERNS.items()
+    }
+    
+    # Lowercase literals matched against the triage key_factors
+    KEY_FACTOR_KEYWORDS = {
+        "gas_leak": ("gas",),
+        "fire_smoke": ("fire", "smoke", "flames"),
+        "carbon_monoxide": ("carbon monoxide", "co alarm"),
+        "electrical_shock": ("spark", "shock", "arcing", "exposed wire"),
+        "sewage": ("sewage",),
+        "water_spreading": ("spreading", "flooding", "water everywhere"),
+        "ceiling_drip": ("ceiling", "dripping"),
+        "getting_worse": ("worse", "spreading", "can't stop"),
+        "evacuated": ("evacuated", "evacuation"),
+    }
+    _KF_SCANNER, _KF_LITERAL_KEYS = _compile_literal_scanner(KEY_FACTOR_KEYWORDS)
+    
+    # Hazard ratio table: factor id -> (name, HR, reason, category, trace label)
+    # Reasons may reference request context via {temp}, {floor}, {total_units}, {recent_count}
+    HAZARD_FACTORS = {
+        # Life Safety
+        "gas_leak": ("Gas leak/smell", 4.0, "Gas mentioned - immediate life safety risk", "LIFE_SAFETY", "Gas (4.0)"),
+        "fire_smoke": ("Fire/flames/smoke", 4.0, "Fire hazard - immediate danger", "LIFE_SAFETY", "Fire (4.0)"),
+        "carbon_monoxide": ("Carbon monoxide alarm", 4.0, "CO detected - life threatening", "LIFE_SAFETY", "CO (4.0)"),
+        "electrical_shock": ("Electrical shock hazard", 3.0, "Active electrical danger present", "LIFE_SAFETY", "Electrical (3.0)"),
+        "sewage": ("Sewage in living area", 2.5, "Health hazard from sewage exposure", "LIFE_SAFETY", "Sewage (2.5)"),
+        # Active Damage
+        "water_spreading": ("Water actively spreading", 2.2, "Active water damage occurring", "ACTIVE_DAMAGE", "Water spreading (2.2)"),
+        "ceiling_drip": ("Ceiling dripping", 1.8, "Water penetrating from above", "ACTIVE_DAMAGE", "Ceiling drip (1.8)"),
+        "getting_worse": ("Situation escalating", 1.6, "Problem actively getting worse", "ACTIVE_DAMAGE", "Getting worse (1.6)"),
+        "evacuated": ("Tenant evacuated", 2.0, "Tenant forced to leave unit", "ACTIVE_DAMAGE", "Evacuated (2.0)"),
+        # Vulnerability
+        "medical": ("Medical condition", 1.8, "Tenant has medical condition requiring consideration", "VULNERABILITY", "Medical (1.8)"),
+        "infant": ("Infant present", 1.6, "Infant in household requires priority", "VULNERABILITY", "Infant (1.6)"),
+        "elderly": ("Elderly tenant", 1.5, "Elderly occupant (75+) requires consideration", "VULNERABILITY", "Elderly (1.5)"),
+        "pregnant": ("Pregnant occupant", 1.4, "Pregnant occupant requires consideration", "VULNERABILITY", "Pregnant (1.4)"),
+        # Environmental
+        "extreme_cold": ("No heat + extreme cold", 2.2, "HVAC issue with outdoor temp {temp}°F (extreme cold)", "ENVIRONMENTAL", "Extreme cold (2.2)"),
+        "cold": ("No heat + cold", 1.6, "HVAC issue with outdoor temp {temp}°F (cold)", "ENVIRONMENTAL", "Cold weather (1.6)"),
+        "extreme_heat": ("No AC + extreme heat", 1.8, "AC issue with outdoor temp {temp}°F (extreme heat)", "ENVIRONMENTAL", "Extreme heat (1.8)"),
+        "freeze_risk": ("Freeze risk", 1.7, "Water/pipe issue with temp {temp}°F (freeze risk)", "ENVIRONMENTAL", "Freeze risk (1.7)"),
+        # Timing
+        "late_night": ("Late night", 1.35, "Request submitted during late night hours (10pm-6am)", "TIMING", "Late night (1.35)"),
+        "holiday": ("Holiday", 1.30, "Request submitted on holiday", "TIMING", "Holiday (1.30)"),
+        "after_hours": ("After hours", 1.25, "Request submitted outside business hours", "TIMING", "After hours (1.25)"),
+        "weekend": ("Weekend", 1.15, "Request submitted on weekend", "TIMING", "Weekend (1.15)"),
+        # Recurrence
+        "third_time": ("Third+ occurrence", 2.0, "Issue reported {recent_count}+ times - recurring problem", "RECURRENCE", "Third+ time (2.0)"),
+        "repair_failed": ("Previous repair failed", 1.7, "Prior repair attempt did not resolve issue", "RECURRENCE", "Repair failed (1.7)"),
+        "recent_issue": ("Recent similar issue", 1.5, "Similar issue reported recently", "RECURRENCE", "Recent issue (1.5)"),
+        # Property Risk
+        "structural": ("Structural concern", 1.6, "Potential structural integrity issue", "PROPERTY_RISK", "Structural (1.6)"),
+        "upper_floor": ("Upper floor water leak", 1.5, "Water issue on floor {floor} - affects units below", "PROPERTY_RISK", "Upper floor (1.5)"),
+        "multi_unit": ("Multi-unit building", 1.4, "Issue in {total_units}-unit building - cascade risk", "PROPERTY_RISK", "Multi-unit (1.4)"),
+        # Essential Service
+        "locked_out": ("Cannot access unit", 2.0, "Tenant unable to safely access unit", "ESSENTIAL_SERVICE", "Locked out (2.0)"),
+        "no_power": ("No electricity", 1.9, "Complete power loss to unit", "ESSENTIAL_SERVICE", "No power (1.9)"),
+        "no_water": ("No running water", 1.8, "Complete water loss", "ESSENTIAL_SERVICE", "No water (1.8)"),
+        "no_toilet": ("No toilet function", 1.7, "No working toilet in unit", "ESSENTIAL_SERVICE", "No toilet (1.7)"),
+    }
     
-    def __init__(self):
-        """Initialize the Priority Calculator."""
-        pass
+    # Interaction ratio table: interaction id -> (name, IR, trigger, trace label)
+    INTERACTION_EFFECTS = {
+        "vuln_env": ("Vulnerability × Environmental", 1.5, "Vulnerable tenant + extreme weather condition", "Vuln×Env (1.5)"),
+        "water_elec": ("Water × Electrical", 1.6, "Water issue near electrical systems", "Water×Elec (1.6)"),
+        "recur_sev": ("Recurrence × High Severity", 1.4, "Recurring issue with {severity} severity", "Recur×Sev (1.4)"),
+        "multi_spread": ("Multi-unit × Spreading", 1.5, "Spreading issue in multi-unit building", "Multi×Spread (1.5)"),
+        "night_emer": ("Late Night × Emergency", 1.25, "Emergency during late night hours", "Night×Emer (1.25)"),
+        "multi_vuln": ("Multiple Vulnerabilities", 1.3, "{vulnerability_count} vulnerability factors present", "Multi-vuln (1.3)"),
+    }
+    
+    # Per-factor traits read by the interaction step: (category, water, electrical, spreading)
+    FACTOR_TRAITS = {
+        fid: (
+            row[3],
+            "water" in row[0].lower(),
+            "electrical" in row[0].lower(),
+            "spreading" in row[0].lower() or "worse" in row[0].lower(),
+        )
+        for fid, row in HAZARD_FACTORS.items()
+    }
+    
+    # Timing factors in priority order (_Ctx flag, factor id); the first set flag wins.
+    # Late night (1.35) > Holiday (1.30) > After hours (1.25) > Weekend (1.15)
+    _TIMING_TABLE = (
+        ("is_late_night", "late_night"),
+        ("is_holiday", "holiday"),
+        ("is_after_hours", "after_hours"),
+        ("is_weekend", "weekend"),
+    )
+    
+    # Flyweights: factors whose reason has no per-request placeholders are
+    # immutable, so one shared instance per id is handed out on every call.
+    _STATIC_FACTORS = {
+        fid: PriorityFactor(name, hazard_ratio, reason, category)
+        for fid, (name, hazard_ratio, reason, category, _) in HAZARD_FACTORS.items()
+        if "{" not in reason
+    }
+    _STATIC_INTERACTIONS = {
+        iid: InteractionEffect(name, interaction_ratio, trigger)
+        for iid, (name, interaction_ratio, trigger, _) in INTERACTION_EFFECTS.items()
+        if "{" not in trigger
+    }
+    
+    # Keyword-driven factors, in the order they are applied within each group
+    LIFE_SAFETY_KEYS = ("gas_leak", "fire_smoke", "carbon_monoxide", "electrical_shock", "sewage")
+    ACTIVE_DAMAGE_KEYS = ("water_spreading", "ceiling_drip", "getting_worse", "evacuated")
+    ESSENTIAL_SERVICE_KEYS = ("locked_out", "no_power", "no_water", "no_toilet")
+    
+    def __init__(self, cache_size: int = 4096, trace_enabled: bool = False):
+        """
+        Initialize the Priority Calculator.
+        
+        Args:
+            cache_size: Max number of memoized results kept (LRU). 0 disables caching.
+            trace_enabled: Build the human-readable calculation_trace. When False
+                the trace is left empty and no per-step formatting is done.
+        """
+        self.cache_size = cache_size
+        self.trace_enabled = trace_enabled
+        self._cache: "OrderedDict[str, PriorityResult]" = OrderedDict()
+    
+    @staticmethod
+    def _cache_key(triage_output: Dict[str, Any], request_data: Dict[str, Any]) -> str:
+        """Build a canonical digest of the calculation inputs."""
+        canonical = json.dumps(
+            [triage_output, request_data], sort_keys=True, default=str
+        )
+        return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
     
     def calculate_priority(
         self,
@@ -121,6 +452,9 @@ class PriorityCalculatorAgent:
         """
         Calculate priority score from triage output and request data.
         
+        The calculation is deterministic, so results are memoized in a bounded
+        LRU cache keyed by a canonical hash of both inputs.
+        
         Args:
             triage_output: Parsed JSON from Triage Agent (severity, trade, key_factors)
             request_data: Original request JSON with context
@@ -128,80 +462,140 @@ class PriorityCalculatorAgent:
         Returns:
             PriorityResult with score and calculation details
         """
+        if self.cache_size <= 0:
+            return self._calculate_priority_uncached(triage_output, request_data)
+        
+        key = self._cache_key(triage_output, request_data)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+        
+        result = self._calculate_priority_uncached(triage_output, request_data)
+        self._cache[key] = result
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return result
+    
+    def calculate_priority_batch(
+        self,
+        triage_outputs: List[Dict[str, Any]],
+        request_datas: List[Dict[str, Any]]
+    ) -> List[PriorityResult]:
+        """
+        Calculate priority scores for many requests in one call.
+        
+        Pairs are scored in order with the method lookups hoisted out of the
+        loop. Identical pairs are computed once: through the LRU cache when it
+        is enabled, otherwise through a cache local to the batch. Rows are not
+        stacked into NumPy arrays: the per-row work is keyword matching, which
+        does not vectorize.
+        
+        Args:
+            triage_outputs: Parsed Triage Agent outputs, one per request
+            request_datas: Original request JSONs, aligned with triage_outputs
+        
+        Returns:
+            List of PriorityResult in input order
+        
+        Raises:
+            ValueError: If the two input lists differ in length
+        """
+        if len(triage_outputs) != len(request_datas):
+            raise ValueError(
+                f"triage_outputs and request_datas must be the same length "
+                f"({len(triage_outputs)} != {len(request_datas)})"
+            )
+        
+        if self.cache_size > 0:
+            calculate = self.calculate_priority
+            return [calculate(t, r) for t, r in zip(triage_outputs, request_datas)]
+        
+        calculate = self._calculate_priority_uncached
+        cache_key = self._cache_key
+        batch_cache: Dict[str, PriorityResult] = {}
+        results = []
+        for triage_output, request_data in zip(triage_outputs, request_datas):
+            key = cache_key(triage_output, request_data)
+            result = batch_cache.get(key)
+            if result is None:
+                result = calculate(triage_output, request_data)
+                batch_cache[key] = result
+            results.append(result)
+        return results
+    
+    def clear_cache(self) -> None:
+        """Drop all memoized priority results."""
+        self._cache.clear()
+    
+    def _calculate_priority_uncached(
+        self,
+        triage_output: Dict[str, Any],
+        request_data: Dict[str, Any]
+    ) -> PriorityResult:
+        """Run the full hazard calculation (no memoization)."""
         # Extract core info
         severity = triage_output.get("severity", "MEDIUM").upper()
         trade = triage_output.get("trade", "GENERAL").upper()
         key_factors = triage_output.get("key_factors", [])
         
-        # Get description
-        description = ""
-        if "request" in request_data:
-            description = request_data["request"].get("description", "").lower()
+        # Lowercase key_factors once and scan the joined blob for every keyword in one pass
+        kf_blob = " | ".join(kf.lower() for kf in key_factors)
+        kf_hits = self._scan_key_factors(kf_blob)
         
-        # Get context
-        context = request_data.get("context", {})
-        weather = context.get("weather", {})
-        tenant = context.get("tenant", {})
-        property_info = context.get("property", {})
-        timing = context.get("timing", {})
-        history = context.get("history", {})
+        # Get description and context (all lowering and dict lookups happen once, here)
+        ctx = _Ctx.from_request(request_data, trade, kf_hits)
         
-        # Initialize tracking
-        applied_factors: List[PriorityFactor] = []
-        applied_interactions: List[InteractionEffect] = []
-        trace_steps: List[str] = []
+        # Values interpolated into factor reasons / interaction triggers
+        reason_args = {
+            "temp": ctx.temp,
+            "floor": ctx.floor,
+            "total_units": ctx.total_units,
+            "recent_count": ctx.recent_count,
+            "severity": severity,
+        }
         
         # Step 1: Get base hazard
         base_hazard = self.BASE_HAZARDS.get(severity, 0.429)
-        h = base_hazard
-        trace_steps.append(f"Base hazard ({severity}): h = {base_hazard:.3f}")
-        
-        # Step 2: Apply Life Safety factors
-        h, factors = self._apply_life_safety_factors(h, description, key_factors, trace_steps)
-        applied_factors.extend(factors)
-        
-        # Step 3: Apply Active Damage factors
-        h, factors = self._apply_active_damage_factors(h, description, key_factors, trace_steps)
-        applied_factors.extend(factors)
-        
-        # Step 4: Apply Vulnerability factors
-        h, factors = self._apply_vulnerability_factors(h, tenant, description, trace_steps)
-        applied_factors.extend(factors)
-        
-        # Step 5: Apply Environmental factors
-        h, factors = self._apply_environmental_factors(h, weather, trade, description, trace_steps)
-        applied_factors.extend(factors)
         
-        # Step 6: Apply Timing factors
-        h, factors = self._apply_timing_factors(h, timing, trace_steps)
-        applied_factors.extend(factors)
-        
-        # Step 7: Apply Recurrence factors
-        h, factors = self._apply_recurrence_factors(h, history, description, trace_steps)
-        applied_factors.extend(factors)
-        
-        # Step 8: Apply Property Risk factors
-        h, factors = self._apply_property_factors(h, property_info, trade, description, trace_steps)
-        applied_factors.extend(factors)
-        
-        # Step 9: Apply Essential Service factors
-        h, factors = self._apply_essential_service_factors(h, description, trace_steps)
-        applied_factors.extend(factors)
-        
-        # Step 10: Apply Interaction effects
-        h, interactions = self._apply_interactions(
-            h, severity, applied_factors, tenant, weather, trade, 
-            property_info, timing, description, trace_steps
-        )
-        applied_interactions.extend(interactions)
-        
-        # Step 11: Calculate final score
+        # Steps 2-9: Select which hazard ratios fire (the factor mask), in order
+        state = _FactorState()
+        traits = self.FACTOR_TRAITS
+        # Every step runs even once the score is pinned near 100: each fired
+        # factor must be reported in applied_factors, so no helper can be skipped.
+        state.add(self._apply_life_safety_factors(ctx), traits)
+        state.add(self._apply_active_damage_factors(ctx), traits)
+        state.add(self._apply_vulnerability_factors(ctx), traits)
+        state.add(self._apply_environmental_factors(ctx), traits)
+        state.add(self._apply_timing_factors(ctx), traits)
+        state.add(self._apply_recurrence_factors(ctx), traits)
+        state.add(self._apply_property_factors(ctx), traits)
+        state.add(self._apply_essential_service_factors(ctx), traits)
+        fired = state.fired
+        applied_factors = [self._make_factor(fid, reason_args) for fid in fired]
+        
+        # Step 10: Select Interaction effects
+        fired_interactions = self._apply_interactions(severity, state, ctx)
+        reason_args["vulnerability_count"] = state.vulnerability_count
+        applied_interactions = [
+            self._make_interaction(iid, reason_args) for iid in fired_interactions
+        ]
+        
+        # Step 11: h = base_hazard × ∏(HR) × ∏(IR) as a single reduction
+        ratios = [f.hazard_ratio for f in applied_factors]
+        ratios += [i.interaction_ratio for i in applied_interactions]
+        h = _hazard_kernel(base_hazard, ratios)
         combined_hazard = h
         priority_score = (100 * h) / (h + 1)
-        trace_steps.append(f"Final: Score = (100 × {h:.3f}) / ({h:.3f} + 1) = {priority_score:.1f}")
+        
+        calculation_trace = ""
+        if self.trace_enabled:
+            calculation_trace = " → ".join(self._build_trace(
+                severity, base_hazard, fired, fired_interactions, priority_score
+            ))
         
         # Calculate confidence based on factor clarity
-        confidence = self._calculate_confidence(applied_factors, severity, description)
+        confidence = self._calculate_confidence(applied_factors, severity, ctx.description)
         
         return PriorityResult(
             priority_score=priority_score,
@@ -210,558 +604,227 @@ class PriorityCalculatorAgent:
             combined_hazard=combined_hazard,
             applied_factors=applied_factors,
             applied_interactions=applied_interactions,
-            calculation_trace=" → ".join(trace_steps),
+            calculation_trace=calculation_trace,
             confidence=confidence
         )
     
+    def _make_factor(self, factor_id: str, reason_args: Dict[str, Any]) -> PriorityFactor:
+        """Materialize a PriorityFactor from the HAZARD_FACTORS table."""
+        factor = self._STATIC_FACTORS.get(factor_id)
+        if factor is not None:
+            return factor
+        name, hazard_ratio, reason, category, _ = self.HAZARD_FACTORS[factor_id]
+        return PriorityFactor(
+            name=name,
+            hazard_ratio=hazard_ratio,
+            reason=reason.format_map(reason_args),
+            category=category
+        )
+    
+    def _make_interaction(
+        self, interaction_id: str, reason_args: Dict[str, Any]
+    ) -> InteractionEffect:
+        """Materialize an InteractionEffect from the INTERACTION_EFFECTS table."""
+        interaction = self._STATIC_INTERACTIONS.get(interaction_id)
+        if interaction is not None:
+            return interaction
+        name, interaction_ratio, trigger, _ = self.INTERACTION_EFFECTS[interaction_id]
+        return InteractionEffect(
+            name=name,
+            interaction_ratio=interaction_ratio,
+            trigger=trigger.format_map(reason_args)
+        )
+    
+    def _build_trace(
+        self, severity: str, base_hazard: float, fired: List[str],
+        fired_interactions: List[str], priority_score: float
+    ) -> List[str]:
+        """Rebuild the step-by-step calculation trace from the fired ids."""
+        h = base_hazard
+        trace = [f"Base hazard ({severity}): h = {base_hazard:.3f}"]
+        for fid in fired:
+            _, hazard_ratio, _, _, label = self.HAZARD_FACTORS[fid]
+            h *= hazard_ratio
+            trace.append(f"× {label} = {h:.3f}")
+        for iid in fired_interactions:
+            _, interaction_ratio, _, label = self.INTERACTION_EFFECTS[iid]
+            h *= interaction_ratio
+            trace.append(f"× {label} = {h:.3f}")
+        trace.append(f"Final: Score = (100 × {h:.3f}) / ({h:.3f} + 1) = {priority_score:.1f}")
+        return trace
+    
     def _check_keywords(self, text: str, pattern_key: str) -> bool:
-        """Check if any keyword pattern matches the text."""
-        patterns = self.KEYWORD_PATTERNS.get(pattern_key, [])
-        for pattern in patterns:
-            if re.search(pattern, text, re.IGNORECASE):
+        """Check if any keyword pattern matches the (already lowercased) text."""
+        # Checked lazily per key on purpose: a single up-front pass over the
+        # description for every literal (one regex alternation or a set of
+        # substring tests) measured slower, since most keys are never asked
+        # and any() stops at the first hit.
+        for literal, pattern in self._COMPILED_PATTERNS.get(pattern_key, ()):
+            if literal in text and (pattern is None or pattern.search(text)):
                 return True
         return False
     
-    def _check_key_factors(self, key_factors: List[str], keywords: List[str]) -> bool:
-        """Check if any keyword appears in key_factors from triage."""
-        key_factors_lower = [kf.lower() for kf in key_factors]
-        for keyword in keywords:
-            for kf in key_factors_lower:
-                if keyword.lower() in kf:
-                    return True
-        return False
+    def _scan_key_factors(self, kf_blob: str) -> frozenset:
+        """Return the KEY_FACTOR_KEYWORDS keys whose literals occur in the blob."""
+        hits = frozenset()
+        for literal in self._KF_SCANNER.findall(kf_blob):
+            hits |= self._KF_LITERAL_KEYS[literal]
+        return hits
     
-    def _apply_life_safety_factors(
-        self, h: float, description: str, key_factors: List[str], trace: List[str]
-    ) -> Tuple[float, List[PriorityFactor]]:
-        """Apply life safety hazard ratios."""
-        factors = []
-        
-        # Gas leak (HR: 4.0)
-        if self._check_keywords(description, "gas_leak") or \
-           self._check_key_factors(key_factors, ["gas"]):
-            h *= 4.0
-            factors.append(PriorityFactor(
-                name="Gas leak/smell",
-                hazard_ratio=4.0,
-                reason="Gas mentioned - immediate life safety risk",
-                category="LIFE_SAFETY"
-            ))
-            trace.append(f"× Gas (4.0) = {h:.3f}")
-        
-        # Fire/smoke (HR: 4.0)
-        if self._check_keywords(description, "fire_smoke") or \
-           self._check_key_factors(key_factors, ["fire", "smoke", "flames"]):
-            h *= 4.0
-            factors.append(PriorityFactor(
-                name="Fire/flames/smoke",
-                hazard_ratio=4.0,
-                reason="Fire hazard - immediate danger",
-                category="LIFE_SAFETY"
-            ))
-            trace.append(f"× Fire (4.0) = {h:.3f}")
-        
-        # Carbon monoxide (HR: 4.0)
-        if self._check_keywords(description, "carbon_monoxide") or \
-           self._check_key_factors(key_factors, ["carbon monoxide", "co alarm"]):
-            h *= 4.0
-            factors.append(PriorityFactor(
-                name="Carbon monoxide alarm",
-                hazard_ratio=4.0,
-                reason="CO detected - life threatening",
-                category="LIFE_SAFETY"
-            ))
-            trace.append(f"× CO (4.0) = {h:.3f}")
-        
-        # Electrical shock hazard (HR: 3.0)
-        if self._check_keywords(description, "electrical_shock") or \
-           self._check_key_factors(key_factors, ["spark", "shock", "arcing", "exposed wire"]):
-            h *= 3.0
-            factors.append(PriorityFactor(
-                name="Electrical shock hazard",
-                hazard_ratio=3.0,
-                reason="Active electrical danger present",
-                category="LIFE_SAFETY"
-            ))
-            trace.append(f"× Electrical (3.0) = {h:.3f}")
-        
-        # Sewage (HR: 2.5)
-        if self._check_keywords(description, "sewage") or \
-           self._check_key_factors(key_factors, ["sewage"]):
-            h *= 2.5
-            factors.append(PriorityFactor(
-                name="Sewage in living area",
-                hazard_ratio=2.5,
-                reason="Health hazard from sewage exposure",
-                category="LIFE_SAFETY"
-            ))
-            trace.append(f"× Sewage (2.5) = {h:.3f}")
-        
-        return h, factors
-    
-    def _apply_active_damage_factors(
-        self, h: float, description: str, key_factors: List[str], trace: List[str]
-    ) -> Tuple[float, List[PriorityFactor]]:
-        """Apply active damage hazard ratios."""
-        factors = []
-        
-        # Water spreading (HR: 2.2)
-        if self._check_keywords(description, "water_spreading") or \
-           self._check_key_factors(key_factors, ["spreading", "flooding", "water everywhere"]):
-            h *= 2.2
-            factors.append(PriorityFactor(
-                name="Water actively spreading",
-                hazard_ratio=2.2,
-                reason="Active water damage occurring",
-                category="ACTIVE_DAMAGE"
-            ))
-            trace.append(f"× Water spreading (2.2) = {h:.3f}")
-        
-        # Ceiling dripping (HR: 1.8)
-        if self._check_keywords(description, "ceiling_drip") or \
-           self._check_key_factors(key_factors, ["ceiling", "dripping"]):
-            h *= 1.8
-            factors.append(PriorityFactor(
-                name="Ceiling dripping",
-                hazard_ratio=1.8,
-                reason="Water penetrating from above",
-                category="ACTIVE_DAMAGE"
-            ))
-            trace.append(f"× Ceiling drip (1.8) = {h:.3f}")
-        
-        # Getting worse (HR: 1.6)
-        if self._check_keywords(description, "getting_worse") or \
-           self._check_key_factors(key_factors, ["worse", "spreading", "can't stop"]):
-            h *= 1.6
-            factors.append(PriorityFactor(
-                name="Situation escalating",
-                hazard_ratio=1.6,
-                reason="Problem actively getting worse",
-                category="ACTIVE_DAMAGE"
-            ))
-            trace.append(f"× Getting worse (1.6) = {h:.3f}")
-        
-        # Evacuated (HR: 2.0)
-        if self._check_keywords(description, "evacuated") or \
-           self._check_key_factors(key_factors, ["evacuated", "evacuation"]):
-            h *= 2.0
-            factors.append(PriorityFactor(
-                name="Tenant evacuated",
-                hazard_ratio=2.0,
-                reason="Tenant forced to leave unit",
-                category="ACTIVE_DAMAGE"
-            ))
-            trace.append(f"× Evacuated (2.0) = {h:.3f}")
-        
-        return h, factors
+    def _keyword_factors(
+        self, keys: Tuple[str, ...], description: str, kf_hits: frozenset = frozenset()
+    ) -> List[str]:
+        """Select keyword-driven factors matched in the description (or key_factors)."""
+        return [
+            key for key in keys
+            if key in kf_hits or self._check_keywords(description, key)
+        ]
     
-    def _apply_vulnerability_factors(
-        self, h: float, tenant: Dict[str, Any], description: str, trace: List[str]
-    ) -> Tuple[float, List[PriorityFactor]]:
-        """Apply tenant vulnerability hazard ratios."""
-        factors = []
+    def _apply_life_safety_factors(self, ctx: _Ctx) -> List[str]:
+        """Select life safety hazard ratios (gas, fire, CO, electrical, sewage)."""
+        return self._keyword_factors(self.LIFE_SAFETY_KEYS, ctx.description, ctx.kf_hits)
+    
+    def _apply_active_damage_factors(self, ctx: _Ctx) -> List[str]:
+        """Select active damage hazard ratios (spreading, dripping, worsening, evacuated)."""
+        return self._keyword_factors(self.ACTIVE_DAMAGE_KEYS, ctx.description, ctx.kf_hits)
+    
+    def _apply_vulnerability_factors(self, ctx: _Ctx) -> List[str]:
+        """Select tenant vulnerability hazard ratios."""
+        fired = []
         
         # Medical condition (HR: 1.8)
-        if tenant.get("has_medical_condition", False):
-            h *= 1.8
-            factors.append(PriorityFactor(
-                name="Medical condition",
-                hazard_ratio=1.8,
-                reason="Tenant has medical condition requiring consideration",
-                category="VULNERABILITY"
-            ))
-            trace.append(f"× Medical (1.8) = {h:.3f}")
+        if ctx.has_medical:
+            fired.append("medical")
         
         # Infant (HR: 1.6)
-        if tenant.get("has_infant", False):
-            h *= 1.6
-            factors.append(PriorityFactor(
-                name="Infant present",
-                hazard_ratio=1.6,
-                reason="Infant in household requires priority",
-                category="VULNERABILITY"
-            ))
-            trace.append(f"× Infant (1.6) = {h:.3f}")
+        if ctx.has_infant:
+            fired.append("infant")
         
         # Elderly (HR: 1.5)
-        is_elderly = tenant.get("is_elderly", False)
-        age = tenant.get("age", 0)
-        if is_elderly or age >= 75:
-            h *= 1.5
-            factors.append(PriorityFactor(
-                name="Elderly tenant",
-                hazard_ratio=1.5,
-                reason="Elderly occupant (75+) requires consideration",
-                category="VULNERABILITY"
-            ))
-            trace.append(f"× Elderly (1.5) = {h:.3f}")
+        if ctx.is_elderly or ctx.age >= 75:
+            fired.append("elderly")
         
         # Pregnant (HR: 1.4)
-        if tenant.get("is_pregnant", False):
-            h *= 1.4
-            factors.append(PriorityFactor(
-                name="Pregnant occupant",
-                hazard_ratio=1.4,
-                reason="Pregnant occupant requires consideration",
-                category="VULNERABILITY"
-            ))
-            trace.append(f"× Pregnant (1.4) = {h:.3f}")
+        if ctx.is_pregnant:
+            fired.append("pregnant")
         
-        return h, factors
+        return fired
     
-    def _apply_environmental_factors(
-        self, h: float, weather: Dict[str, Any], trade: str, description: str, trace: List[str]
-    ) -> Tuple[float, List[PriorityFactor]]:
-        """Apply environmental stress hazard ratios."""
-        factors = []
-        temp = weather.get("temperature", 70)
-        
-        is_heating_issue = trade in ["HVAC"] or self._check_keywords(description, "no_heat")
-        is_cooling_issue = trade in ["HVAC"] or self._check_keywords(description, "no_ac")
-        is_water_issue = trade in ["PLUMBING"]
-        
-        # Extreme cold + no heat (HR: 2.2)
+    def _apply_environmental_factors(self, ctx: _Ctx) -> List[str]:
+        """Select environmental stress hazard ratios."""
+        fired = []
+        temp = ctx.temp
+        trade = ctx.trade
+        description = ctx.description
+        
+        is_heating_issue = trade == "HVAC" or self._check_keywords(description, "no_heat")
+        is_cooling_issue = trade == "HVAC" or self._check_keywords(description, "no_ac")
+        is_water_issue = trade == "PLUMBING"
+        
+        # Extreme cold + no heat (HR: 2.2), else cold + no heat (HR: 1.6)
         if temp < 40 and is_heating_issue:
-            h *= 2.2
-            factors.append(PriorityFactor(
-                name="No heat + extreme cold",
-                hazard_ratio=2.2,
-                reason=f"HVAC issue with outdoor temp {temp}°F (extreme cold)",
-                category="ENVIRONMENTAL"
-            ))
-            trace.append(f"× Extreme cold (2.2) = {h:.3f}")
-        # Cold + no heat (HR: 1.6)
+            fired.append("extreme_cold")
         elif temp < 50 and is_heating_issue:
-            h *= 1.6
-            factors.append(PriorityFactor(
-                name="No heat + cold",
-                hazard_ratio=1.6,
-                reason=f"HVAC issue with outdoor temp {temp}°F (cold)",
-                category="ENVIRONMENTAL"
-            ))
-            trace.append(f"× Cold weather (1.6) = {h:.3f}")
+            fired.append("cold")
         
         # Extreme heat + no AC (HR: 1.8)
         if temp > 95 and is_cooling_issue:
-            h *= 1.8
-            factors.append(PriorityFactor(
-                name="No AC + extreme heat",
-                hazard_ratio=1.8,
-                reason=f"AC issue with outdoor temp {temp}°F (extreme heat)",
-                category="ENVIRONMENTAL"
-            ))
-            trace.append(f"× Extreme heat (1.8) = {h:.3f}")
+            fired.append("extreme_heat")
         
         # Freeze risk (HR: 1.7)
         if temp < 32 and is_water_issue:
-            h *= 1.7
-            factors.append(PriorityFactor(
-                name="Freeze risk",
-                hazard_ratio=1.7,
-                reason=f"Water/pipe issue with temp {temp}°F (freeze risk)",
-                category="ENVIRONMENTAL"
-            ))
-            trace.append(f"× Freeze risk (1.7) = {h:.3f}")
-        
-        return h, factors
-    
-    def _apply_timing_factors(
-        self, h: float, timing: Dict[str, Any], trace: List[str]
-    ) -> Tuple[float, List[PriorityFactor]]:
-        """Apply timing hazard ratios. Only one timing factor applies (most specific)."""
-        factors = []
-        
-        # Late night takes precedence (HR: 1.35)
-        if timing.get("is_late_night", False):
-            h *= 1.35
-            factors.append(PriorityFactor(
-                name="Late night",
-                hazard_ratio=1.35,
-                reason="Request submitted during late night hours (10pm-6am)",
-                category="TIMING"
-            ))
-            trace.append(f"× Late night (1.35) = {h:.3f}")
-        # Holiday (HR: 1.30)
-        elif timing.get("is_holiday", False):
-            h *= 1.30
-            factors.append(PriorityFactor(
-                name="Holiday",
-                hazard_ratio=1.30,
-                reason="Request submitted on holiday",
-                category="TIMING"
-            ))
-            trace.append(f"× Holiday (1.30) = {h:.3f}")
-        # After hours (HR: 1.25)
-        elif timing.get("is_after_hours", False):
-            h *= 1.25
-            factors.append(PriorityFactor(
-                name="After hours",
-                hazard_ratio=1.25,
-                reason="Request submitted outside business hours",
-                category="TIMING"
-            ))
-            trace.append(f"× After hours (1.25) = {h:.3f}")
-        # Weekend (HR: 1.15)
-        elif timing.get("is_weekend", False):
-            h *= 1.15
-            factors.append(PriorityFactor(
-                name="Weekend",
-                hazard_ratio=1.15,
-                reason="Request submitted on weekend",
-                category="TIMING"
-            ))
-            trace.append(f"× Weekend (1.15) = {h:.3f}")
+            fired.append("freeze_risk")
         
-        return h, factors
+        return fired
+    
+    def _apply_timing_factors(self, ctx: _Ctx) -> List[str]:
+        """Select timing hazard ratios. Only one timing factor applies (most specific)."""
+        for flag, factor_id in self._TIMING_TABLE:
+            if getattr(ctx, flag):
+                return [factor_id]
+        return []
     
-    def _apply_recurrence_factors(
-        self, h: float, history: Dict[str, Any], description: str, trace: List[str]
-    ) -> Tuple[float, List[PriorityFactor]]:
-        """Apply recurrence hazard ratios."""
-        factors = []
+    def _apply_recurrence_factors(self, ctx: _Ctx) -> List[str]:
+        """Select recurrence hazard ratios (at most one applies)."""
+        recent_count = ctx.recent_count
+        description = ctx.description
         
         # Third+ occurrence (HR: 2.0)
-        recent_count = history.get("recent_issues_count", 0)
         if recent_count >= 3 or self._check_keywords(description, "third_time"):
-            h *= 2.0
-            factors.append(PriorityFactor(
-                name="Third+ occurrence",
-                hazard_ratio=2.0,
-                reason=f"Issue reported {recent_count}+ times - recurring problem",
-                category="RECURRENCE"
-            ))
-            trace.append(f"× Third+ time (2.0) = {h:.3f}")
+            return ["third_time"]
         # Previous repair failed (HR: 1.7)
-        elif history.get("previous_repair_failed", False) or \
+        elif ctx.previous_repair_failed or \
              self._check_keywords(description, "repair_failed"):
-            h *= 1.7
-            factors.append(PriorityFactor(
-                name="Previous repair failed",
-                hazard_ratio=1.7,
-                reason="Prior repair attempt did not resolve issue",
-                category="RECURRENCE"
-            ))
-            trace.append(f"× Repair failed (1.7) = {h:.3f}")
+            return ["repair_failed"]
         # Same issue within 60 days (HR: 1.5)
         elif recent_count >= 1:
-            h *= 1.5
-            factors.append(PriorityFactor(
-                name="Recent similar issue",
-                hazard_ratio=1.5,
-                reason="Similar issue reported recently",
-                category="RECURRENCE"
-            ))
-            trace.append(f"× Recent issue (1.5) = {h:.3f}")
-        
-        return h, factors
+            return ["recent_issue"]
+        return []
     
-    def _apply_property_factors(
-        self, h: float, property_info: Dict[str, Any], trade: str, 
-        description: str, trace: List[str]
-    ) -> Tuple[float, List[PriorityFactor]]:
-        """Apply property risk hazard ratios."""
-        factors = []
+    def _apply_property_factors(self, ctx: _Ctx) -> List[str]:
+        """Select property risk hazard ratios."""
+        fired = []
         
         # Structural concern (HR: 1.6)
-        if self._check_keywords(description, "structural"):
-            h *= 1.6
-            factors.append(PriorityFactor(
-                name="Structural concern",
-                hazard_ratio=1.6,
-                reason="Potential structural integrity issue",
-                category="PROPERTY_RISK"
-            ))
-            trace.append(f"× Structural (1.6) = {h:.3f}")
+        if self._check_keywords(ctx.description, "structural"):
+            fired.append("structural")
         
         # Upper floor water leak (HR: 1.5)
-        floor = property_info.get("floor")
-        if floor and floor > 1 and trade == "PLUMBING":
-            h *= 1.5
-            factors.append(PriorityFactor(
-                name="Upper floor water leak",
-                hazard_ratio=1.5,
-                reason=f"Water issue on floor {floor} - affects units below",
-                category="PROPERTY_RISK"
-            ))
-            trace.append(f"× Upper floor (1.5) = {h:.3f}")
+        if ctx.floor and ctx.floor > 1 and ctx.trade == "PLUMBING":
+            fired.append("upper_floor")
         
         # Multi-unit cascade risk (HR: 1.4)
-        total_units = property_info.get("total_units", 1)
-        if total_units > 1:
-            h *= 1.4
-            factors.append(PriorityFactor(
-                name="Multi-unit building",
-                hazard_ratio=1.4,
-                reason=f"Issue in {total_units}-unit building - cascade risk",
-                category="PROPERTY_RISK"
-            ))
-            trace.append(f"× Multi-unit (1.4) = {h:.3f}")
-        
-        return h, factors
-    
-    def _apply_essential_service_factors(
-        self, h: float, description: str, trace: List[str]
-    ) -> Tuple[float, List[PriorityFactor]]:
-        """Apply essential service loss hazard ratios."""
-        factors = []
-        
-        # Cannot access unit (HR: 2.0)
-        if self._check_keywords(description, "locked_out"):
-            h *= 2.0
-            factors.append(PriorityFactor(
-                name="Cannot access unit",
-                hazard_ratio=2.0,
-                reason="Tenant unable to safely access unit",
-                category="ESSENTIAL_SERVICE"
-            ))
-            trace.append(f"× Locked out (2.0) = {h:.3f}")
-        
-        # No electricity (HR: 1.9)
-        if self._check_keywords(description, "no_power"):
-            h *= 1.9
-            factors.append(PriorityFactor(
-                name="No electricity",
-                hazard_ratio=1.9,
-                reason="Complete power loss to unit",
-                category="ESSENTIAL_SERVICE"
-            ))
-            trace.append(f"× No power (1.9) = {h:.3f}")
-        
-        # No running water (HR: 1.8)
-        if self._check_keywords(description, "no_water"):
-            h *= 1.8
-            factors.append(PriorityFactor(
-                name="No running water",
-                hazard_ratio=1.8,
-                reason="Complete water loss",
-                category="ESSENTIAL_SERVICE"
-            ))
-            trace.append(f"× No water (1.8) = {h:.3f}")
-        
-        # No toilet (HR: 1.7)
-        if self._check_keywords(description, "no_toilet"):
-            h *= 1.7
-            factors.append(PriorityFactor(
-                name="No toilet function",
-                hazard_ratio=1.7,
-                reason="No working toilet in unit",
-                category="ESSENTIAL_SERVICE"
-            ))
-            trace.append(f"× No toilet (1.7) = {h:.3f}")
+        if ctx.total_units > 1:
+            fired.append("multi_unit")
         
-        return h, factors
+        return fired
+    
+    def _apply_essential_service_factors(self, ctx: _Ctx) -> List[str]:
+        """Select essential service loss hazard ratios."""
+        return self._keyword_factors(self.ESSENTIAL_SERVICE_KEYS, ctx.description)
     
     def _apply_interactions(
-        self, h: float, severity: str, applied_factors: List[PriorityFactor],
-        tenant: Dict[str, Any], weather: Dict[str, Any], trade: str,
-        property_info: Dict[str, Any], timing: Dict[str, Any],
-        description: str, trace: List[str]
-    ) -> Tuple[float, List[InteractionEffect]]:
-        """Apply interaction effects for compound risks."""
-        interactions = []
-        
-        # Get factor categories present
-        categories = {f.category for f in applied_factors}
-        factor_names = {f.name.lower() for f in applied_factors}
+        self, severity: str, state: _FactorState, ctx: _Ctx
+    ) -> List[str]:
+        """Select interaction effects for compound risks."""
+        fired = []
+        categories = state.categories
         
         # Vulnerability × Environmental (IR: 1.5)
-        has_vulnerability = "VULNERABILITY" in categories
-        has_environmental = "ENVIRONMENTAL" in categories
-        if has_vulnerability and has_environmental:
-            h *= 1.5
-            interactions.append(InteractionEffect(
-                name="Vulnerability × Environmental",
-                interaction_ratio=1.5,
-                trigger="Vulnerable tenant + extreme weather condition"
-            ))
-            trace.append(f"× Vuln×Env (1.5) = {h:.3f}")
+        if "VULNERABILITY" in categories and "ENVIRONMENTAL" in categories:
+            fired.append("vuln_env")
         
         # Water × Electrical (IR: 1.6)
-        has_water = any(f for f in applied_factors if "water" in f.name.lower())
-        has_electrical = trade == "ELECTRICAL" or any(
-            f for f in applied_factors if "electrical" in f.name.lower()
-        )
-        if has_water and has_electrical:
-            h *= 1.6
-            interactions.append(InteractionEffect(
-                name="Water × Electrical",
-                interaction_ratio=1.6,
-                trigger="Water issue near electrical systems"
-            ))
-            trace.append(f"× Water×Elec (1.6) = {h:.3f}")
+        if state.has_water and (ctx.trade == "ELECTRICAL" or state.has_electrical):
+            fired.append("water_elec")
         
         # Recurrence × High Severity (IR: 1.4)
-        has_recurrence = "RECURRENCE" in categories
-        is_high_severity = severity in ["HIGH", "EMERGENCY"]
-        if has_recurrence and is_high_severity:
-            h *= 1.4
-            interactions.append(InteractionEffect(
-                name="Recurrence × High Severity",
-                interaction_ratio=1.4,
-                trigger=f"Recurring issue with {severity} severity"
-            ))
-            trace.append(f"× Recur×Sev (1.4) = {h:.3f}")
+        if "RECURRENCE" in categories and severity in self.RECURRENCE_SEVERITIES:
+            fired.append("recur_sev")
         
         # Multi-unit × Spreading (IR: 1.5)
-        total_units = property_info.get("total_units", 1)
-        has_spreading = any(f for f in applied_factors if "spreading" in f.name.lower() or "worse" in f.name.lower())
-        if total_units > 1 and has_spreading:
-            h *= 1.5
-            interactions.append(InteractionEffect(
-                name="Multi-unit × Spreading",
-                interaction_ratio=1.5,
-                trigger="Spreading issue in multi-unit building"
-            ))
-            trace.append(f"× Multi×Spread (1.5) = {h:.3f}")
+        if ctx.total_units > 1 and state.has_spreading:
+            fired.append("multi_spread")
         
         # Late Night × Emergency (IR: 1.25)
-        is_late_night = timing.get("is_late_night", False)
-        is_emergency = severity == "EMERGENCY"
-        if is_late_night and is_emergency:
-            h *= 1.25
-            interactions.append(InteractionEffect(
-                name="Late Night × Emergency",
-                interaction_ratio=1.25,
-                trigger="Emergency during late night hours"
-            ))
-            trace.append(f"× Night×Emer (1.25) = {h:.3f}")
+        if ctx.is_late_night and severity == "EMERGENCY":
+            fired.append("night_emer")
         
         # Multiple Vulnerabilities (IR: 1.3)
-        vulnerability_count = len([f for f in applied_factors if f.category == "VULNERABILITY"])
-        if vulnerability_count >= 2:
-            h *= 1.3
-            interactions.append(InteractionEffect(
-                name="Multiple Vulnerabilities",
-                interaction_ratio=1.3,
-                trigger=f"{vulnerability_count} vulnerability factors present"
-            ))
-            trace.append(f"× Multi-vuln (1.3) = {h:.3f}")
+        if state.vulnerability_count >= 2:
+            fired.append("multi_vuln")
         
-        return h, interactions
+        return fired
+    
     
     def _calculate_confidence(
         self, applied_factors: List[PriorityFactor], severity: str, description: str
     ) -> float:
         """Calculate confidence score based on factor clarity."""
-        confidence = 0.85  # Base confidence for deterministic calculation
-        
-        # More factors = more confidence (clear signals)
-        if len(applied_factors) >= 3:
-            confidence += 0.05
-        elif len(applied_factors) == 0:
-            confidence -= 0.10
-        
-        # Clear severity indicators
-        if severity in ["EMERGENCY", "LOW"]:
-            confidence += 0.05  # Clear extremes
-        
-        # Description length affects confidence
-        if len(description) > 100:
-            confidence += 0.05  # Detailed description
-        elif len(description) < 20:
-            confidence -= 0.10  # Too short
-        
-        return max(0.5, min(1.0, confidence))
+        # Reduce the inputs to plain numbers; the scoring lives in the kernel
+        return _confidence_kernel(
+            len(applied_factors), severity in self.CLEAR_SEVERITIES, len(description)
+        )
     
     def run(
         self,
@@ -781,7 +844,10 @@ class PriorityCalculatorAgent:
         return self.calculate_priority(triage_output, request_data)
     
     def __repr__(self) -> str:
-        return "PriorityCalculatorAgent(deterministic=True)"
+        return (
+            f"PriorityCalculatorAgent(deterministic=True, cache_size={self.cache_size}, "
+            f"trace_enabled={self.trace_enabled})"
+        )
 
 
 
@@ -3,8 +3,10 @@ Agent 1: Triage Classifier Agent
 Classifies maintenance requests by severity and trade category.
 """
 
-from typing import Any, Dict
-from .base_agent import BaseAgent
+import json
+from typing import Any, Dict, List, Optional
+from .base_agent import BaseAgent, dumps_json
+from . import triage_fast_path
 from ..prompts import SYSTEM_PROMPT_TRIAGE
 
 
@@ -21,6 +23,13 @@ class TriageAgent(BaseAgent):
     Also provides reasoning and confidence score.
     """
     
+    # Request fields that never change the classification (snake_case from the
+    # API and test fixtures, camelCase from the Lambda's maintenance events)
+    VOLATILE_FIELDS = frozenset({
+        "test_id", "request_id", "reported_at",
+        "testId", "requestId", "reportedAt", "maintenanceId",
+    })
+    
     def __init__(self, model: str = "gpt-5-mini"):
         super().__init__(
             name="Triage Classifier Agent",
@@ -32,6 +41,36 @@ class TriageAgent(BaseAgent):
     def system_prompt(self) -> str:
         return SYSTEM_PROMPT_TRIAGE
     
+    async def run(
+        self,
+        input_prompt: str,
+        cache_key: Optional[str] = None,
+        request_data: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """
+        Classify a request, answering mandatory emergencies without the LLM.
+        
+        Args:
+            input_prompt: The prompt from build_prompt().
+            cache_key: Optional response cache key (see cache_key()).
+            request_data: The structured request; enables the local fast path
+                for phrases the system prompt makes an automatic EMERGENCY.
+            
+        Returns:
+            The agent's response (a FastPathResult on a fast-path hit).
+        """
+        mode = triage_fast_path.FAST_PATH_MODE
+        fast = None
+        if request_data is not None and mode in ("on", "shadow"):
+            fast = triage_fast_path.fast_path_triage(request_data)
+        if fast is not None and mode == "on":
+            return triage_fast_path.fast_path_result(fast)
+        
+        result = await super().run(input_prompt, cache_key=cache_key)
+        if fast is not None:
+            print(f"[triage fast path shadow] fast={json.dumps(fast)} llm={result.final_output}")
+        return result
+    
     def build_prompt(self, request_data: Dict[str, Any]) -> str:
         """
         Build the user prompt for triage classification.
@@ -42,6 +81,81 @@ class TriageAgent(BaseAgent):
         Returns:
             Formatted prompt string.
         """
-        import json
-        request_json = json.dumps(request_data, indent=2)
+        request_json = dumps_json(request_data)
         return f"this is the description of the request: {request_json}"
+    
+    def build_prompt_batch(self, requests: List[Dict[str, Any]]) -> str:
+        """
+        Build one user prompt that classifies several requests in a single call.
+        
+        The system prompt and the round trip are paid once for the whole batch;
+        the system prompt's multiple-request rule makes the model answer with
+        {"results": [...]} in index order.
+        
+        Args:
+            requests: Request dictionaries, each as passed to build_prompt().
+            
+        Returns:
+            Formatted prompt string with the requests indexed [0]..[N-1].
+        """
+        header = (
+            f"Classify these {len(requests)} requests. "
+            f"Return a JSON object {{\"results\": [...]}} indexed 0..{len(requests) - 1}."
+        )
+        body = "\n---\n".join(
+            f"[{i}] {dumps_json(request_data)}" for i, request_data in enumerate(requests)
+        )
+        return f"{header}\n\n{body}"
+    
+    async def run_batch(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Classify several requests with one LLM call.
+        
+        Args:
+            requests: Request dictionaries to classify.
+            
+        Returns:
+            One parsed triage result per request, in input order.
+            
+        Raises:
+            ValueError: If the response is not JSON, or is neither a
+                {"results": [...]} object nor a bare array, or has the wrong
+                number of results.
+        """
+        if not requests:
+            return []
+        result = await self.run(self.build_prompt_batch(requests))
+        text = result.final_output.strip()
+        if text.startswith("```"):
+            text = text.strip("`").removeprefix("json")
+        parsed = json.loads(text)
+        # The prompt asks for {"results": [...]}, but a bare array is accepted too
+        results = parsed.get("results") if isinstance(parsed, dict) else parsed
+        if not isinstance(results, list) or len(results) != len(requests):
+            raise ValueError(
+                f"Expected {len(requests)} triage results, got "
+                f"{len(results) if isinstance(results, list) else 'none'}"
+            )
+        return results
+    
+    def cache_key(self, request_data: Dict[str, Any]) -> str:
+        """
+        Build the response cache key for a request.
+        
+        Identifiers and timestamps do not affect the classification, so they are
+        dropped and the rest is serialized canonically (sorted keys). Repeat
+        requests with the same description and context then share a cache entry.
+        
+        Args:
+            request_data: Dictionary containing the maintenance request and context.
+            
+        Returns:
+            Canonical JSON string to pass as run(..., cache_key=...).
+        """
+        canonical = {k: v for k, v in request_data.items() if k not in self.VOLATILE_FIELDS}
+        if isinstance(canonical.get("request"), dict):
+            canonical["request"] = {
+                k: v for k, v in canonical["request"].items()
+                if k not in self.VOLATILE_FIELDS
+            }
+        return dumps_json(canonical)
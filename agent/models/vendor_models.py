@@ -37,7 +37,7 @@ class VendorTier(str, Enum):
     BUDGET = "BUDGET"        # Cost-effective
 
 
-@dataclass
+@dataclass(slots=True)
 class TimeSlot:
     """Available time slot."""
     day: str          # e.g., "Monday", "2024-12-18"
@@ -50,7 +50,7 @@ class TimeSlot:
         return f"{self.day} {self.start_time}-{self.end_time}{emergency}"
 
 
-@dataclass
+@dataclass(slots=True)
 class VendorRating:
     """Vendor performance ratings."""
     overall_rating: float  # 1.0-5.0
@@ -69,7 +69,7 @@ class VendorRating:
         return (self.completed_jobs / self.total_jobs) * 100
 
 
-@dataclass
+@dataclass(slots=True)
 class VendorLocation:
     """Vendor location and service area."""
     address: str
@@ -81,7 +81,7 @@ class VendorLocation:
     service_radius_miles: int
 
 
-@dataclass
+@dataclass(slots=True)
 class VendorExpertise:
     """Vendor expertise and specializations."""
     primary_trade: TradeCategory
@@ -99,7 +99,7 @@ class VendorExpertise:
         return any(t.value == trade_upper for t in self.secondary_trades)
 
 
-@dataclass
+@dataclass(slots=True)
 class VendorPricing:
     """Vendor pricing structure."""
     hourly_rate: float
@@ -111,7 +111,7 @@ class VendorPricing:
     trip_fee: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class Vendor:
     """Complete vendor profile."""
     vendor_id: str
@@ -3,8 +3,9 @@ Triage Pipeline
 Orchestrates the flow of data through multiple agents.
 """
 
+import asyncio
 import json
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -13,14 +14,17 @@ from ..core_agents import (
     PriorityAgent, 
     ExplainerAgent, 
     ConfidenceAgent, 
+    ExplainerConfidenceAgent,
     SLAMapperAgent, 
     SLAResult,
     PriorityCalculatorAgent,
     PriorityResult
 )
+from ..core_agents import confidence_agent as confidence_module
+from ..core_agents.triage_fast_path import FastPathResult
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineResult:
     """Result from the triage pipeline."""
     triage_output: str
@@ -32,6 +36,7 @@ class PipelineResult:
     priority_parsed: Optional[Dict[str, Any]] = None
     explainer_parsed: Optional[Dict[str, Any]] = None
     confidence_parsed: Optional[Dict[str, Any]] = None
+    pending: Optional["asyncio.Task[PipelineResult]"] = None
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert result to dictionary."""
@@ -56,11 +61,23 @@ class TriagePipeline:
     
     Agent 1 (Triage/LLM) → Agent 2 (Priority/LLM) → Agent 3 (Explainer/LLM) → Agent 4 (Confidence/LLM) → Agent 5 (SLA/Deterministic) → Final Result
     
+    Agent 4 is answered locally when Agent 1 is already unambiguous (see
+    ConfidenceAgent.shortcut). Otherwise Agents 3 and 4 run as one fused LLM
+    call (ExplainerConfidenceAgent) unless fuse_explainer_confidence=False.
+    With defer_emergency_explanations=True, EMERGENCY results are returned
+    before Agents 3 and 4 finish; await result.pending for the full result.
+    
     Usage:
         pipeline = TriagePipeline()
         result = await pipeline.run(request_data)
     """
     
+    # Explainer output placeholder while a deferred EMERGENCY explanation runs
+    PENDING_EXPLANATION = {
+        "pm_explanation": "Explanation pending: EMERGENCY dispatched before the explanation finished.",
+        "tenant_explanation": "Your emergency request has been received and is being dispatched now."
+    }
+    
     def __init__(
         self,
         triage_model: str = "gpt-5-mini",
@@ -68,6 +85,8 @@ class TriagePipeline:
         explainer_model: str = "gpt-5-mini",
         confidence_model: str = "gpt-5-mini",
         use_deterministic_priority: bool = False,
+        fuse_explainer_confidence: bool = True,
+        defer_emergency_explanations: bool = False,
         verbose: bool = True
     ):
         """
@@ -79,17 +98,25 @@ class TriagePipeline:
             explainer_model: Model to use for explainer agent.
             confidence_model: Model to use for confidence agent.
             use_deterministic_priority: Use deterministic priority calculator (faster but less intelligent). Default: False (uses LLM).
+            fuse_explainer_confidence: Produce the explanation and confidence with one LLM call (uses explainer_model). Default: True.
+            defer_emergency_explanations: Return EMERGENCY results right after priority and SLA, with the explanation and confidence finishing in the background (see PipelineResult.pending). Needs a long-lived event loop. Default: False.
             verbose: Whether to print progress messages.
         """
         self.triage_agent = TriageAgent(model=triage_model)
         self.use_deterministic_priority = use_deterministic_priority
         if use_deterministic_priority:
-            self.priority_calculator = PriorityCalculatorAgent()
+            # Keep the trace: the explainer agent reads it from the priority output
+            self.priority_calculator = PriorityCalculatorAgent(trace_enabled=True)
         else:
             self.priority_agent = PriorityAgent(model=priority_model)
         self.explainer_agent = ExplainerAgent(model=explainer_model)
         self.confidence_agent = ConfidenceAgent(model=confidence_model)
+        self.fuse_explainer_confidence = fuse_explainer_confidence
+        if fuse_explainer_confidence:
+            self.explainer_confidence_agent = ExplainerConfidenceAgent(model=explainer_model)
         self.sla_mapper = SLAMapperAgent()
+        self.defer_emergency_explanations = defer_emergency_explanations
+        self._background_tasks = set()
         self.verbose = verbose
     
     def _log(self, message: str) -> None:
@@ -97,6 +124,21 @@ class TriagePipeline:
         if self.verbose:
             print(message)
     
+    async def _run_explainer_stage(self, agent: Any, prompt: str, header: str) -> Any:
+        """Run an explanation-writing agent, streaming its output in verbose mode."""
+        if not self.verbose:
+            return await agent.run(prompt)
+        # The explanation is the longest output; print it as it is generated
+        self._log(header)
+        result = await agent.run_streamed(prompt, on_delta=self._print_delta)
+        print()
+        return result
+    
+    @staticmethod
+    def _print_delta(text: str) -> None:
+        """Print a chunk of streamed agent output without a line break."""
+        print(text, end="", flush=True)
+    
     def _parse_json_safe(self, text: str) -> Optional[Dict[str, Any]]:
         """Safely parse JSON from agent output."""
         try:
@@ -113,6 +155,103 @@ class TriagePipeline:
         except json.JSONDecodeError:
             return None
     
+    async def _explain_and_evaluate(
+        self,
+        request_prompt: str,
+        triage_output: str,
+        triage_parsed: Optional[Dict[str, Any]],
+        priority_output: str,
+        fast_path: bool
+    ) -> Tuple[str, str]:
+        """
+        Run the explanation and confidence stages (Agents 3 and 4).
+        
+        Returns:
+            (explainer_output, confidence_output) as raw agent output text.
+        """
+        confidence_is_local = (
+            confidence_module.CONF_SHORTCIRCUIT_MODE == "on"
+            and self.confidence_agent.shortcut(triage_parsed, fast_path=fast_path) is not None
+        )
+        
+        if self.fuse_explainer_confidence and not confidence_is_local:
+            # Steps 3+4: one LLM call writes both the explanation and the confidence
+            self._log("\n[STEP 3+4] Running Explainer + Confidence Evaluator Agent (LLM)...")
+            self._log("-" * 40)
+            
+            fused_prompt = self.explainer_confidence_agent.build_prompt(
+                triage_output=triage_output,
+                priority_output=priority_output,
+                original_request=request_prompt,
+            )
+            fused_result = await self._run_explainer_stage(
+                self.explainer_confidence_agent, fused_prompt,
+                "\n✅ Agents 3+4 (Explainer + Confidence Evaluator) Output:"
+            )
+            explainer_output, confidence_output = self.explainer_confidence_agent.split_output(
+                fused_result.final_output
+            )
+        else:
+            # Step 3: Run Explainer Agent (LLM)
+            explainer_prompt = self.explainer_agent.build_prompt(
+                triage_output=triage_output,
+                priority_output=priority_output,
+                original_request=request_prompt,
+            )
+            self._log("\n[STEP 3] Running Explainer Agent (LLM)...")
+            self._log("-" * 40)
+            
+            explainer_result = await self._run_explainer_stage(
+                self.explainer_agent, explainer_prompt, "\n✅ Agent 3 (Explainer) Output:"
+            )
+            explainer_output = explainer_result.final_output
+            
+            # Step 4: Run Confidence Agent (LLM, or local when triage is unambiguous)
+            confidence_prompt = self.confidence_agent.build_prompt(
+                triage_output=triage_output,
+                priority_output=priority_output,
+                explainer_output=explainer_output,
+                original_request=request_prompt,
+            )
+            self._log("\n[STEP 4] Running Confidence Evaluator Agent (LLM)...")
+            self._log("-" * 40)
+            
+            confidence_result = await self.confidence_agent.run(
+                confidence_prompt,
+                triage_parsed=triage_parsed,
+                fast_path=fast_path
+            )
+            confidence_output = confidence_result.final_output
+            if isinstance(confidence_result, FastPathResult):
+                self._log("(Triage confidence is unambiguous - evaluator LLM call skipped)")
+            
+            self._log("\n✅ Agent 4 (Confidence Evaluator) Output:")
+            self._log(confidence_output)
+        
+        return explainer_output, confidence_output
+    
+    async def _complete_deferred(
+        self,
+        result: PipelineResult,
+        request_prompt: str,
+        triage_parsed: Optional[Dict[str, Any]],
+        fast_path: bool
+    ) -> PipelineResult:
+        """Finish the explanation and confidence of a deferred result in place."""
+        try:
+            explainer_output, confidence_output = await self._explain_and_evaluate(
+                request_prompt, result.triage_output, triage_parsed,
+                result.priority_output, fast_path
+            )
+        except Exception as e:
+            print(f"[TriagePipeline] deferred explanation failed: {e}")
+            return result
+        result.explainer_output = explainer_output
+        result.confidence_output = confidence_output
+        result.explainer_parsed = self._parse_json_safe(explainer_output)
+        result.confidence_parsed = self._parse_json_safe(confidence_output)
+        return result
+    
     async def run(
         self, 
         request_prompt: str, 
@@ -138,7 +277,14 @@ class TriagePipeline:
         self._log("\n[STEP 1] Running Triage Classifier Agent (LLM)...")
         self._log("-" * 40)
         
-        triage_result = await self.triage_agent.run(request_prompt)
+        # With the structured request at hand, cache on its canonical form so
+        # repeats differing only in ids/timestamps skip the LLM call
+        triage_cache_key = None
+        if request_data:
+            triage_cache_key = self.triage_agent.cache_key(request_data)
+        triage_result = await self.triage_agent.run(
+            request_prompt, cache_key=triage_cache_key, request_data=request_data
+        )
         triage_output = triage_result.final_output
         
         self._log("\n✅ Agent 1 (Triage Classifier) Output:")
@@ -174,40 +320,23 @@ class TriagePipeline:
         self._log("\n✅ Agent 2 (Priority Calculator) Output:")
         self._log(priority_output)
 
-        # Step 3: Build prompt for Explainer Agent
-        explainer_prompt = self.explainer_agent.build_prompt(
-            triage_output=triage_output,
-            priority_output=priority_output,
-            original_request=request_prompt,
+        fast_path = isinstance(triage_result, FastPathResult)
+        deferred = (
+            self.defer_emergency_explanations
+            and bool(triage_parsed)
+            and triage_parsed.get("severity") == "EMERGENCY"
         )
-
-        # Step 4: Run Explainer Agent (LLM)
-        self._log("\n[STEP 3] Running Explainer Agent (LLM)...")
-        self._log("-" * 40)
-
-        explainer_result = await self.explainer_agent.run(explainer_prompt)
-        explainer_output = explainer_result.final_output
-
-        self._log("\n✅ Agent 3 (Explainer) Output:")
-        self._log(explainer_output)
-
-        # Step 5: Build prompt for Confidence Agent
-        confidence_prompt = self.confidence_agent.build_prompt(
-            triage_output=triage_output,
-            priority_output=priority_output,
-            explainer_output=explainer_output,
-            original_request=request_prompt,
-        )
-
-        # Step 6: Run Confidence Agent (LLM)
-        self._log("\n[STEP 4] Running Confidence Evaluator Agent (LLM)...")
-        self._log("-" * 40)
-
-        confidence_result = await self.confidence_agent.run(confidence_prompt)
-        confidence_output = confidence_result.final_output
-
-        self._log("\n✅ Agent 4 (Confidence Evaluator) Output:")
-        self._log(confidence_output)
+        if deferred:
+            # Dispatch must not wait on the explanation; use provisional outputs
+            self._log("\n(EMERGENCY - explanation and confidence continue in the background)")
+            explainer_output = json.dumps(self.PENDING_EXPLANATION, indent=2)
+            confidence_output = json.dumps(
+                self.confidence_agent.provisional(triage_parsed, fast_path=fast_path), indent=2
+            )
+        else:
+            explainer_output, confidence_output = await self._explain_and_evaluate(
+                request_prompt, triage_output, triage_parsed, priority_output, fast_path
+            )
         
         # Parse remaining outputs
         explainer_parsed = self._parse_json_safe(explainer_output)
@@ -244,6 +373,14 @@ class TriagePipeline:
             explainer_parsed=explainer_parsed,
             confidence_parsed=confidence_parsed,
         )
+        if deferred:
+            task = asyncio.create_task(
+                self._complete_deferred(result, request_prompt, triage_parsed, fast_path)
+            )
+            # Hold a reference until it finishes; the loop only keeps weak ones
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+            result.pending = task
         
         # Print summary
         self._log("\n" + "=" * 60)
@@ -278,6 +415,45 @@ class TriagePipeline:
         
         return result
     
+    async def run_batch(
+        self,
+        request_prompts: List[str],
+        request_datas: Optional[List[Optional[Dict[str, Any]]]] = None
+    ) -> List[Union[PipelineResult, Exception]]:
+        """
+        Run the pipeline for several requests concurrently.
+        
+        Every stage is an I/O-bound LLM call, so the requests are in flight
+        together and the batch takes about as long as its slowest request.
+        Each request moves to its next stage as soon as its own previous stage
+        finishes; nothing waits on the rest of the batch.
+        
+        Args:
+            request_prompts: Formatted maintenance request prompts.
+            request_datas: Optional original request data, one per prompt.
+            
+        Returns:
+            One PipelineResult per request in input order, or the exception
+            that request raised.
+            
+        Raises:
+            ValueError: If request_datas does not match request_prompts in length.
+        """
+        if request_datas is None:
+            request_datas = [None] * len(request_prompts)
+        if len(request_datas) != len(request_prompts):
+            raise ValueError(
+                f"Got {len(request_prompts)} prompts but {len(request_datas)} request_datas"
+            )
+        
+        return await asyncio.gather(
+            *(
+                self.run(prompt, request_data=request_data)
+                for prompt, request_data in zip(request_prompts, request_datas)
+            ),
+            return_exceptions=True
+        )
+    
     async def run_with_data(self, request_data: Dict[str, Any]) -> PipelineResult:
         """
         Run the pipeline with structured request data.
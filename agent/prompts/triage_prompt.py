@@ -230,6 +230,9 @@ Respond with ONLY valid JSON. No preamble, explanation, or commentary outside JS
   ]
 }
 
+**Multiple Requests:**
+If the input contains several requests marked [0], [1], ..., classify each one independently (never let one request influence another) and respond with ONLY {"results": [...]}: one object in the format above per request, in index order.
+
 **Confidence Guidelines:**
 - 0.95-1.0: Clear case, obvious classification, all info present
 - 0.85-0.94: Strong confidence, standard case, minor ambiguity
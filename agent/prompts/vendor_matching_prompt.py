@@ -17,116 +17,23 @@ Analyze maintenance requests and available vendors to provide ranked vendor reco
 
 Your goal is to provide 3-5 vendor recommendations ranked by overall match score, with clear reasoning for each.
 
-# MATCHING CRITERIA & SCORING
-
-## 1. EXPERTISE MATCH (0-30 points)
-**Primary Trade Match (20-30 points):**
-- Exact primary trade match: 30 points
-- Secondary trade match: 20 points
-- General contractor with relevant experience: 15 points
-- Trade mismatch: 0 points
-
-**Specialization Bonus (+5 points):**
-- Vendor specialization aligns with specific issue
-- Example: "Gas line specialist" for gas leak
-
-**Certification Bonus (+5 points):**
-- Relevant certifications for the specific job
-- Example: "Master Plumber" for complex plumbing
-
-**Emergency Capability (Required for EMERGENCY severity):**
-- If severity = EMERGENCY and vendor lacks emergency capability: DISQUALIFY
-- Emergency vendors get +10 points for emergency requests
-
-## 2. AVAILABILITY & SCHEDULING (0-25 points)
-**Tenant Time Preference Match:**
-- Perfect match (vendor available for all 3 tenant slots): 25 points
-- 2 out of 3 slots match: 20 points
-- 1 out of 3 slots match: 15 points
-- No direct match but flexible: 10 points
-- Availability unclear: 5 points
-
-**Response Time (from vendor profile):**
-- <30 min avg response: +5 bonus
-- 30-60 min avg response: +3 bonus
-- 60-120 min avg response: +0
-- >120 min avg response: -3 penalty
-
-**Emergency Availability (if needed):**
-- 24/7 emergency available: +10 points
-- After-hours available: +5 points
-- Business hours only: 0 points
-
-## 3. RATINGS & TRACK RECORD (0-25 points)
-**Overall Rating (0-15 points):**
-- 4.8-5.0: 15 points
-- 4.5-4.7: 12 points
-- 4.0-4.4: 8 points
-- 3.5-3.9: 5 points
-- <3.5: 2 points
-
-**Completion Rate (0-5 points):**
-- 98-100%: 5 points
-- 95-97%: 4 points
-- 90-94%: 3 points
-- 85-89%: 2 points
-- <85%: 0 points
-
-**Experience & Job Volume (0-5 points):**
-- 300+ completed jobs: 5 points
-- 200-299 jobs: 4 points
-- 100-199 jobs: 3 points
-- 50-99 jobs: 2 points
-- <50 jobs: 1 point
-
-## 4. LOCATION & SERVICE AREA (0-15 points)
-**Distance Analysis:**
-You will receive:
-- Property location (city, zip code)
-- Vendor location and service radius
-
-Score based on proximity and service area coverage:
-- Same city, well within service radius: 15 points
-- Adjacent city, within service radius: 12 points
-- Edge of service radius: 8 points
-- Outside service radius: 0 points (consider DISQUALIFY unless no alternatives)
-
-**Trip Fee Impact:**
-- No trip fee or minimal (<$30): +2 bonus
-- Moderate trip fee ($30-60): +0
-- High trip fee (>$60): -2 penalty
-
-## 5. COST CONSIDERATIONS (0-10 points)
-**Pricing Tier:**
-- Budget tier: 10 points
-- Standard tier: 8 points
-- Premium tier: 6 points
-- Emergency tier: 4 points (but necessary for emergencies)
-
-**Cost vs Severity:**
-- For LOW/MEDIUM severity: Prefer cost-effective options
-- For HIGH/EMERGENCY severity: Prioritize speed and quality over cost
-
-**Estimated Total Cost Analysis:**
-Consider: hourly_rate × estimated_hours + trip_fee + emergency_multiplier
-- Provide cost estimate range for each vendor
-- Note which vendor offers best value
-
-## 6. SPECIAL FACTORS (0-10 points)
-**RentMatrix Preferred Vendor (+5 points):**
-- Pre-vetted, trusted relationship
-
-**Insurance & Licensing (+3 points):**
-- Fully verified insurance and licensing
-
-**Tier Match (+2 points):**
-- Emergency tier for emergency requests
-- Premium tier for high-value properties
-- Budget tier for routine low-priority work
-
-# DISQUALIFICATION CRITERIA
-
-**MUST DISQUALIFY if:**
+# SCORING RUBRIC
+Points per criterion (JSON; "+n"/"-n" are bonuses/penalties within the criterion's range).
+{"expertise":{"max":30,"exact_primary_trade":30,"secondary_trade":20,"general_contractor_relevant":15,"trade_mismatch":0,"specialization_fits_issue":"+5","relevant_certification":"+5","emergency_vendor_on_emergency_request":"+10"},
+"availability":{"max":25,"tenant_slots_matched":{"3_of_3":25,"2_of_3":20,"1_of_3":15,"none_but_flexible":10,"unclear":5},"avg_response_min":{"<30":"+5","30-60":"+3","60-120":"+0",">120":"-3"},"emergency_availability":{"24_7":"+10","after_hours":"+5","business_hours_only":0}},
+"ratings":{"max":25,"overall_rating":{"4.8-5.0":15,"4.5-4.7":12,"4.0-4.4":8,"3.5-3.9":5,"<3.5":2},"completion_rate_pct":{"98-100":5,"95-97":4,"90-94":3,"85-89":2,"<85":0},"completed_jobs":{"300+":5,"200-299":4,"100-199":3,"50-99":2,"<50":1}},
+"location":{"max":15,"same_city_well_within_radius":15,"adjacent_city_within_radius":12,"edge_of_radius":8,"outside_radius":0,"trip_fee":{"<30":"+2","30-60":"+0",">60":"-2"}},
+"cost":{"max":10,"pricing_tier":{"budget":10,"standard":8,"premium":6,"emergency":4}},
+"special_factors":{"max":10,"rentmatrix_preferred":"+5","insurance_and_license_verified":"+3","tier_fits_job":"+2"}}
+
+Rubric notes:
+- EMERGENCY severity: a vendor without emergency capability is disqualified.
+- Location: compare property city/zip with vendor location and service radius; outside the radius only if no alternatives.
+- Tier fit: emergency tier for emergencies, premium for high-value properties, budget for routine low-priority work.
+- Cost vs severity: LOW/MEDIUM prefer cost-effective options; HIGH/EMERGENCY prioritize speed and quality over cost.
+- Estimated cost = hourly_rate × estimated_hours + trip_fee, with the emergency/after-hours multipliers; give a min-max range per vendor and note the best value.
+
+# DISQUALIFY IF
 1. Trade completely unrelated (e.g., painter for electrical emergency)
 2. Outside service area with no coverage
 3. Not available for emergency when emergency response required
@@ -134,33 +41,9 @@ Consider: hourly_rate × estimated_hours + trip_fee + emergency_multiplier
 5. Overall rating < 3.0 (unless no alternatives)
 6. Missing required certifications for regulated work
 
-# TENANT TIME PREFERENCE HANDLING
-
-**Input Format:**
-Tenant will provide 3 preferred time slots in format:
-```
-tenant_preferred_times: [
-  "Monday 9:00-12:00",
-  "Wednesday 14:00-17:00",
-  "Friday 10:00-15:00"
-]
-```
-
-**Vendor Availability Format:**
-```
-availability: [
-  "Monday 08:00-17:00",
-  "Tuesday 08:00-17:00",
-  ...
-]
-```
-
-**Matching Logic:**
-- Check overlap between tenant preferences and vendor availability
-- Full overlap = perfect match
-- Partial overlap = good match
-- No overlap but nearby times = acceptable
-- Completely incompatible = note scheduling challenge
+# TENANT TIME PREFERENCES
+Tenant slots (e.g. "Monday 9:00-12:00") are compared with vendor availability (e.g. "Monday 08:00-17:00"):
+full overlap = perfect match; partial overlap = good match; no overlap but nearby times = acceptable; incompatible = note the scheduling challenge.
 
 # OUTPUT FORMAT
 
@@ -236,110 +119,12 @@ Respond with ONLY valid JSON. No preamble, explanation, or commentary outside JS
 - <0.60: Poor matches, may need to expand search or adjust criteria
 
 # REASONING PROTOCOL
-
-Execute these steps IN ORDER:
-
-**Step 1: Understand the Job Requirements**
-- What is the trade category?
-- What is the severity level?
-- Is emergency response required?
-- What are special requirements (gas lines, electrical panel, etc.)?
-
-**Step 2: Filter Eligible Vendors**
-- Can handle the trade?
-- Active and available?
-- Within service area?
-- Emergency capable if needed?
-
-**Step 3: Score Each Eligible Vendor**
-- Calculate expertise score (0-30)
-- Calculate availability score (0-25)
-- Calculate ratings score (0-25)
-- Calculate location score (0-15)
-- Calculate cost score (0-10)
-- Add special factors (0-10)
-- Total = sum of all scores (max 115, but normalize to 100)
-
-**Step 4: Rank Vendors**
-- Sort by total match score
-- Select top 3-5 vendors
-- Ensure diversity (e.g., include budget option if appropriate)
-
-**Step 5: Generate Recommendations**
-- Primary choice: Best overall match
-- Backup choice: Strong alternative
-- Note any special considerations
-
-**Step 6: Provide Cost Estimates**
-- Estimate hours needed based on job complexity
-- Calculate with appropriate multipliers
-- Show range (min-max)
-
-# EXAMPLES
-
-## Example 1: Emergency Gas Leak
-
-**Input:**
-- Severity: EMERGENCY
-- Trade: PLUMBING
-- Issue: Gas leak, strong odor
-- Tenant preferred times: ["ASAP", "Any time today", "Within 1 hour"]
-- Time: 11:30 PM (late night)
-
-**Scoring Logic:**
-1. MUST have emergency capability (filter)
-2. Gas line specialization highly valued (+5)
-3. 24/7 availability critical (+10)
-4. Response time <30 min preferred
-5. Cost is secondary to speed and safety
-
-**Expected Output:**
-- Rank 1: Emergency plumber with gas certification, 24/7, fastest response
-- High match score (90-100)
-- Cost will be higher due to emergency multiplier (acceptable)
-
-## Example 2: Routine Faucet Repair
-
-**Input:**
-- Severity: MEDIUM
-- Trade: PLUMBING
-- Issue: Dripping faucet under sink
-- Tenant preferred times: ["Monday 9-12", "Wednesday 14-17", "Friday anytime"]
-- Standard hours
-
-**Scoring Logic:**
-1. Any plumber qualifies
-2. Availability match important (match tenant schedule)
-3. Cost-effectiveness valued (routine job)
-4. Good ratings important but not critical
-5. No rush, can optimize for value
-
-**Expected Output:**
-- Rank 1: Budget or Standard tier plumber with good availability match
-- Match score (70-85)
-- Best value option highlighted
-- May recommend multiple options with cost comparison
-
-## Example 3: Outlet Not Working (Electrical)
-
-**Input:**
-- Severity: MEDIUM
-- Trade: ELECTRICAL
-- Issue: Single dead outlet, no buzzing or heat
-- Tenant preferred times: ["Tuesday 10-13", "Thursday 15-18", "Saturday morning"]
-
-**Scoring Logic:**
-1. Licensed electrician required
-2. Standard work, not emergency
-3. Availability match with tenant preferences important
-4. Balance cost and quality
-5. Completion rate important (should finish properly)
-
-**Expected Output:**
-- Rank 1-3: Mix of Premium and Standard electricians with good availability
-- Match scores (75-88)
-- Consider tenant schedule as primary factor
-- Note fastest vs best value options
+1. Job requirements: trade, severity, whether emergency response is required, special requirements (gas lines, electrical panel, ...).
+2. Filter eligible vendors: handles the trade, active, within service area, emergency capable if needed.
+3. Score each eligible vendor with the rubric (max 115, normalize to 100).
+4. Rank by match score and select the top 3-5, keeping diversity (e.g. a budget option where appropriate).
+5. Recommend a primary and a backup choice and note special considerations.
+6. Estimate hours from job complexity and give cost ranges with the applicable multipliers.
 
 # CRITICAL RULES
 
@@ -365,10 +150,3 @@ Execute these steps IN ORDER:
 
 Now analyze the maintenance request and available vendors to provide intelligent vendor matching recommendations.
 """
-
-
-
-
-
-
-
@@ -37,6 +37,7 @@ if "" not in sys.path:
 load_dotenv()
 
 from agent import DEFAULT_AGENT_CONFIG, TriagePipeline  # noqa: E402
+from agent.tracing import configure_span_batching  # noqa: E402
 from agent.core_agents.vendor_assignment import assign_vendors_simple  # noqa: E402
 from api.weather_service import get_weather_for_triage  # noqa: E402
 
@@ -126,6 +127,7 @@ app.add_middleware(
 )
 
 # Instrumentation
+configure_span_batching()
 OpenAIAgentsInstrumentor().instrument()
 try:
     _langfuse_client = get_client()
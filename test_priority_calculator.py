@@ -0,0 +1,61 @@
+"""
+Test Priority Calculator
+Compares the hazard kernel with the log-space formulation over every
+combination of distinct ratios.
+"""
+
+import math
+from itertools import combinations
+
+from agent.core_agents.priority_calculator_agent import (
+    PriorityCalculatorAgent,
+    _hazard_kernel,
+)
+
+
+HAZARD_RATIOS = sorted({row[1] for row in PriorityCalculatorAgent.HAZARD_FACTORS.values()})
+INTERACTION_RATIOS = sorted({row[1] for row in PriorityCalculatorAgent.INTERACTION_EFFECTS.values()})
+
+
+def _subsets(values):
+    for size in range(len(values) + 1):
+        yield from combinations(values, size)
+
+
+def _log_kernel(base_hazard, ratios):
+    """The log-space evaluation h = exp(log(base) + Σ log(ratio))."""
+    return math.exp(math.log(base_hazard) + math.fsum(math.log(r) for r in ratios))
+
+
+def _score(h):
+    return (100 * h) / (h + 1)
+
+
+def test_hazard_kernel_matches_trace_product():
+    """The kernel equals the step-by-step product printed in the trace."""
+    for base_hazard in PriorityCalculatorAgent.BASE_HAZARDS.values():
+        for ratios in _subsets(HAZARD_RATIOS):
+            h = base_hazard
+            for ratio in ratios:
+                h *= ratio
+            assert _hazard_kernel(base_hazard, ratios) == h
+
+
+def test_log_kernel_differs_only_by_rounding():
+    """Both kernels agree to a few ulps and give the same rounded score."""
+    worst = 0.0
+    for base_hazard in PriorityCalculatorAgent.BASE_HAZARDS.values():
+        for factor_ratios in _subsets(HAZARD_RATIOS):
+            for interaction_ratios in ((), tuple(INTERACTION_RATIOS)):
+                ratios = factor_ratios + interaction_ratios
+                h = _hazard_kernel(base_hazard, ratios)
+                h_log = _log_kernel(base_hazard, ratios)
+                worst = max(worst, abs(h - h_log) / h)
+                assert round(_score(h), 1) == round(_score(h_log), 1)
+    assert worst < 1e-13
+
+
+if __name__ == "__main__":
+    test_hazard_kernel_matches_trace_product()
+    test_log_kernel_differs_only_by_rounding()
+    print("[OK] Priority calculator tests passed")
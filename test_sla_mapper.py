@@ -0,0 +1,29 @@
+"""
+Test SLA Mapper
+Checks that memoized business-hours deadlines are not shared across UTC offsets.
+"""
+
+from datetime import datetime
+
+from agent.core_agents.sla_mapper_agent import SLAMapperAgent
+
+
+def test_deadline_cache_respects_utc_offset():
+    """The same instant in two offsets gets each offset's own wall-clock deadline."""
+    utc_start = datetime.fromisoformat("2025-01-07T08:30:00+00:00")
+    est_start = datetime.fromisoformat("2025-01-07T03:30:00-05:00")
+    assert utc_start == est_start
+
+    cached = SLAMapperAgent()
+    utc_sla = cached.calculate_sla(50, utc_start)
+    est_sla = cached.calculate_sla(50, est_start)
+
+    # Fresh mappers never see the other offset's cached walk
+    assert utc_sla.to_dict() == SLAMapperAgent().calculate_sla(50, utc_start).to_dict()
+    assert est_sla.to_dict() == SLAMapperAgent().calculate_sla(50, est_start).to_dict()
+    assert est_sla.response_deadline.utcoffset() == est_start.utcoffset()
+
+
+if __name__ == "__main__":
+    test_deadline_cache_respects_utc_offset()
+    print("[OK] SLA mapper tests passed")
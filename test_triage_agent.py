@@ -0,0 +1,60 @@
+"""
+Test Triage Agent
+Checks how run_batch handles well-formed, malformed and wrong-length batch
+responses, with the LLM call replaced by a canned reply.
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from agent.core_agents.triage_agent import TriageAgent
+
+
+REQUESTS = [
+    {"request": {"description": "Kitchen faucet dripping"}},
+    {"request": {"description": "Bedroom door won't latch"}},
+]
+
+RESULT = {"severity": "LOW", "trade": "PLUMBING", "reasoning": "r", "confidence": 0.9, "key_factors": []}
+
+
+def _run_batch(reply: str):
+    """Run run_batch against a TriageAgent whose LLM call returns reply."""
+    agent = TriageAgent()
+
+    async def fake_run(input_prompt, cache_key=None, request_data=None):
+        return SimpleNamespace(final_output=reply)
+
+    agent.run = fake_run
+    return asyncio.run(agent.run_batch(REQUESTS))
+
+
+def test_results_object_and_bare_array():
+    """Both {"results": [...]} and a bare JSON array are accepted."""
+    results = [RESULT, RESULT]
+    assert _run_batch(json.dumps({"results": results})) == results
+    assert _run_batch(f"```json\n{json.dumps(results)}\n```") == results
+
+
+def test_malformed_responses_raise_value_error():
+    """Non-JSON, scalar and result-less replies raise ValueError."""
+    for reply in ("not json", '"LOW"', "42", '{"answer": []}', '{"results": "LOW"}'):
+        with pytest.raises(ValueError):
+            _run_batch(reply)
+
+
+def test_wrong_length_raises_value_error():
+    """A result count that differs from the request count raises ValueError."""
+    for reply in ('{"results": []}', '[{"severity": "LOW"}]', '[{}, {}, {}]'):
+        with pytest.raises(ValueError):
+            _run_batch(reply)
+
+
+if __name__ == "__main__":
+    test_results_object_and_bare_array()
+    test_malformed_responses_raise_value_error()
+    test_wrong_length_raises_value_error()
+    print("[OK] Triage agent tests passed")
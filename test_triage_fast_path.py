@@ -0,0 +1,54 @@
+"""
+Test Triage Fast Path
+Checks which descriptions the deterministic pre-classifier answers as EMERGENCY
+and that negated mentions are left to the Triage Agent.
+"""
+
+from agent.core_agents.triage_fast_path import fast_path_triage
+
+
+EMERGENCY_DESCRIPTIONS = [
+    "Strong gas smell in the kitchen",
+    "Gas leak! We evacuated the building",
+    "CO alarm going off in the hallway",
+    "Sparks flying from the outlet",
+    "There's no heat but I smell gas",
+    "The stove doesn't work. Gas smell near the oven",
+]
+
+NEGATED_DESCRIPTIONS = [
+    "There is no gas smell",
+    "We were not evacuated",
+    "I don't smell gas anymore",
+    "I don’t smell gas anymore",
+    "i dont smell gas",
+    "No longer a gas smell in the unit",
+    "I never smelled gas",
+    "Haven't noticed any gas odor",
+    "The gas smell isn't there anymore",
+    "The smell of gas is not there anymore",
+]
+
+
+def _triage(description: str):
+    return fast_path_triage({"request": {"description": description}})
+
+
+def test_emergency_phrases_take_fast_path():
+    """Un-negated mandatory-emergency phrases are classified locally."""
+    for description in EMERGENCY_DESCRIPTIONS:
+        result = _triage(description)
+        assert result is not None, description
+        assert result["severity"] == "EMERGENCY"
+
+
+def test_negated_phrases_go_to_llm():
+    """Negated mentions (contractions, no longer, never, anymore) are not matched."""
+    for description in NEGATED_DESCRIPTIONS:
+        assert _triage(description) is None, description
+
+
+if __name__ == "__main__":
+    test_emergency_phrases_take_fast_path()
+    test_negated_phrases_go_to_llm()
+    print("[OK] Triage fast path tests passed")
@@ -0,0 +1,126 @@
+"""
+Helper functions shared by lambda_handler.py and triage_processor.py
+Parse agent output text and format it for the backend dto.
+"""
+
+import json
+import re
+
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib json
+    orjson = None
+
+
+def loads_json(text):
+    """Parse JSON text (orjson when installed, stdlib otherwise)"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def dumps_json(obj):
+    """Serialize to a compact JSON string (orjson when installed, stdlib otherwise)"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str).decode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), default=str)
+
+
+def extract_result_text(result):
+    """Extract text from RunResult object"""
+    if hasattr(result, 'data'):
+        return str(result.data)
+    elif hasattr(result, 'content'):
+        return str(result.content)
+    elif hasattr(result, 'text'):
+        return str(result.text)
+    else:
+        return str(result)
+
+
+# Decodes the JSON object embedded in RunResult text in one C-level pass;
+# strict=False accepts the raw newlines LLMs leave inside string values
+_JSON_DECODER = json.JSONDecoder(strict=False)
+
+# Fallback patterns for a flat JSON object containing search_key, compiled once per key
+_KEY_PATTERNS = {}
+
+
+def _key_pattern(search_key):
+    """Compiled pattern matching a flat JSON object that contains search_key"""
+    pattern = _KEY_PATTERNS.get(search_key)
+    if pattern is None:
+        pattern = _KEY_PATTERNS[search_key] = re.compile(
+            r'\{[^{}]*"' + re.escape(search_key) + r'"[^{}]*\}', re.DOTALL
+        )
+    return pattern
+
+
+def parse_json_result(result_text, search_key="severity"):
+    """Parse JSON from result text with fallback regex"""
+    try:
+        return loads_json(result_text)
+    except json.JSONDecodeError:
+        # Try to find JSON embedded in RunResult text
+        # Look for the pattern: Final output (str): followed by JSON
+        if 'Final output (str):' in result_text:
+            # Extract everything after "Final output (str):"
+            start_idx = result_text.find('Final output (str):') + len('Final output (str):')
+            remainder = result_text[start_idx:]
+            
+            # Find the JSON object - look for opening brace
+            json_start = remainder.find('{')
+            if json_start != -1:
+                # Decode the complete object starting there; text after it is ignored
+                try:
+                    return _JSON_DECODER.raw_decode(remainder, json_start)[0]
+                except json.JSONDecodeError:
+                    pass
+        
+        # Fallback: try to find any JSON with the search key
+        json_match = _key_pattern(search_key).search(result_text)
+        if json_match:
+            return loads_json(json_match.group(0))
+        else:
+            return {"raw_output": result_text}
+
+
+def snake_to_camel(snake_str):
+    """Convert snake_case to camelCase"""
+    # One title() over the tail capitalizes every component at once (underscores
+    # are word boundaries), instead of a generator and title() per component
+    head, _, rest = snake_str.partition('_')
+    return head + rest.title().replace('_', '') if rest else head
+
+
+# snake_case keys the agents emit; their camelCase forms are computed once here
+# and any other key is converted on first sight and remembered
+KNOWN_SNAKE_KEYS = frozenset({
+    "severity", "trade", "reasoning", "confidence", "key_factors",
+    "priority_score", "base_hazard", "combined_hazard", "applied_factors",
+    "applied_interactions", "calculation_trace", "factor", "hr", "reason",
+    "interaction", "ir", "trigger",
+    "pm_explanation", "tenant_explanation",
+    "routing", "confidence_factors", "risk_flags", "recommendation", "impact", "points",
+    "tier", "response_deadline", "resolution_deadline", "response_hours",
+    "resolution_hours", "business_hours_only", "vendor_tier",
+})
+_CAMEL_KEYS = {key: snake_to_camel(key) for key in KNOWN_SNAKE_KEYS}
+
+
+def camel_key(key):
+    """Look up (or compute and remember) the camelCase form of a key"""
+    camel = _CAMEL_KEYS.get(key)
+    if camel is None:
+        camel = _CAMEL_KEYS[key] = snake_to_camel(key)
+    return camel
+
+
+def convert_keys_to_camel(obj):
+    """Recursively convert all dictionary keys from snake_case to camelCase"""
+    if isinstance(obj, dict):
+        return {camel_key(k): convert_keys_to_camel(v) for k, v in obj.items()}
+    elif isinstance(obj, list):
+        return [convert_keys_to_camel(item) for item in obj]
+    else:
+        return obj
@@ -8,6 +8,7 @@ Modules:
     - prompts: System prompts for each agent
     - pipeline: Pipeline orchestration
     - config: Configuration settings
+    - tracing: Non-blocking Langfuse flushing
 
 Usage:
     from agent import TriagePipeline
@@ -0,0 +1,95 @@
+"""
+Agents 3+4: Fused Explainer + Confidence Evaluator Agent
+Produces the explanations and the confidence assessment with one LLM call.
+"""
+
+import json
+from typing import Tuple
+from .base_agent import BaseAgent
+from ..prompts import SYSTEM_PROMPT_EXPLAINER_CONFIDENCE
+
+
+class ExplainerConfidenceAgent(BaseAgent):
+    """
+    Fused Explainer + Confidence Evaluator Agent
+
+    Both agents read the same triage and priority outputs, so one call writes
+    both results and the shared context is sent (and prefilled) once.
+    split_output() returns the two results in the shapes the separate
+    ExplainerAgent and ConfidenceAgent produce.
+    """
+
+    # Output keys belonging to each of the fused agents
+    EXPLAINER_KEYS = ("pm_explanation", "tenant_explanation")
+    CONFIDENCE_KEYS = ("confidence", "routing", "confidence_factors", "risk_flags", "recommendation")
+
+    def __init__(self, model: str = "gpt-5-mini"):
+        super().__init__(
+            name="Explainer Confidence Agent",
+            model=model,
+            temperature=0.3
+        )
+
+    @property
+    def system_prompt(self) -> str:
+        return SYSTEM_PROMPT_EXPLAINER_CONFIDENCE
+
+    def build_prompt(
+        self,
+        triage_output: str,
+        priority_output: str,
+        original_request: str,
+    ) -> str:
+        """
+        Build the user prompt for the fused explainer/confidence call.
+
+        Args:
+            triage_output: JSON output from the Triage Agent.
+            priority_output: JSON output from the Priority Agent.
+            original_request: The original maintenance request prompt text.
+
+        Returns:
+            Formatted prompt string.
+        """
+        return f"""
+Explain the triage decision and evaluate its confidence based on the following:
+
+## TRIAGE_RESULT (from Agent 1)
+{triage_output}
+
+## PRIORITY_RESULT (from Agent 2)
+{priority_output}
+
+## ORIGINAL_REQUEST
+{original_request}
+
+Respond with the JSON schema defined in the system prompt.
+"""
+
+    def split_output(self, output: str) -> Tuple[str, str]:
+        """
+        Split the fused response into explainer and confidence outputs.
+
+        Args:
+            output: Raw text of the fused agent's response.
+
+        Returns:
+            (explainer_output, confidence_output) as JSON strings. If the
+            response is not a JSON object, both are the raw text so callers
+            fall back to their unparsed handling.
+        """
+        text = output.strip()
+        if text.startswith("```"):
+            text = text.strip("`")
+            if text.startswith("json"):
+                text = text[4:]
+        try:
+            parsed = json.loads(text)
+        except json.JSONDecodeError:
+            return output, output
+        if not isinstance(parsed, dict):
+            return output, output
+
+        explainer = {key: parsed[key] for key in self.EXPLAINER_KEYS if key in parsed}
+        confidence = {key: parsed[key] for key in self.CONFIDENCE_KEYS if key in parsed}
+        return json.dumps(explainer, indent=2), json.dumps(confidence, indent=2)
@@ -4,11 +4,11 @@ Maps priority scores to response and resolution deadlines (deterministic, no LLM
 """
 
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SLAResult:
     """Result from SLA calculation."""
     tier: str
@@ -45,6 +45,9 @@ class SLAMapperAgent:
     This agent does NOT use LLM - it's a pure deterministic calculation.
     """
     
+    # Memoized business-hours deadlines kept per mapper (cleared when full)
+    DEADLINE_CACHE_SIZE = 1024
+    
     def __init__(
         self,
         business_hours_start: int = 9,
@@ -62,6 +65,9 @@ class SLAMapperAgent:
         self.business_hours_start = business_hours_start
         self.business_hours_end = business_hours_end
         self.business_days = business_days or [0, 1, 2, 3, 4]  # Mon-Fri
+        self._deadline_cache: Dict[
+            Tuple[datetime, Optional[timedelta], int], datetime
+        ] = {}
     
     def calculate_sla(
         self,
@@ -143,6 +149,27 @@ class SLAMapperAgent:
         Returns:
             Deadline datetime
         """
+        # The walk below starts by moving to the start of a business period,
+        # which drops the minutes, so the deadline only depends on the hour
+        # the request was submitted in. The walk runs on wall-clock time, so
+        # the key is the naive local hour plus the UTC offset (aware datetimes
+        # for the same instant in different offsets compare equal).
+        key = (
+            start_time.replace(minute=0, second=0, microsecond=0, tzinfo=None),
+            start_time.utcoffset(),
+            hours_needed,
+        )
+        deadline = self._deadline_cache.get(key)
+        if deadline is None:
+            if len(self._deadline_cache) >= self.DEADLINE_CACHE_SIZE:
+                self._deadline_cache.clear()
+            deadline = self._deadline_cache[key] = self._walk_business_hours(
+                start_time, hours_needed
+            )
+        return deadline
+    
+    def _walk_business_hours(self, start_time: datetime, hours_needed: int) -> datetime:
+        """Step through business periods until hours_needed have elapsed."""
         current = start_time
         hours_remaining = hours_needed
         
@@ -0,0 +1,147 @@
+"""
+Triage Fast Path
+Deterministic pre-classifier for the mandatory-EMERGENCY rules of the triage prompt.
+
+The triage system prompt makes some phrases an automatic EMERGENCY regardless
+of anything else in the request (gas is always an emergency, evacuation is an
+automatic emergency, ...). Matching those locally answers the most
+latency-critical requests without an LLM round trip; everything else still
+goes to the Triage Agent.
+"""
+
+import json
+import os
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+
+# "on": answer matches locally. "shadow" (default): still call the LLM, log
+# both results for comparison and return the LLM's. "off": always call the LLM.
+FAST_PATH_MODE = os.getenv("TRIAGE_FAST_PATH", "shadow").lower()
+
+# Phrases the triage prompt classifies as EMERGENCY unconditionally
+EMERGENCY_PHRASES = (
+    "gas leak", "gas smell", "gas odor", "smell of gas", "smell gas", "natural gas",
+    "carbon monoxide", "co alarm", "co detector",
+    "evacuated", "everyone out", "called 911", "call 911", "fire department",
+    "got shocked", "felt electricity", "sparks flying", "saw sparks",
+    "flames", "smoke from",
+)
+
+_EMERGENCY_PATTERN = re.compile(
+    r"\b(?:"
+    + "|".join(re.escape(phrase) for phrase in EMERGENCY_PHRASES)
+    + r")\b"
+)
+
+# Negation cues that cancel a phrase in the same clause ("no gas smell",
+# "don't smell gas", "no longer a gas smell", "gas smell isn't there anymore")
+_NEGATION_BEFORE = re.compile(
+    r"\b(?:no|not|never|no longer|without|cannot|\w+n['’]t|"
+    r"dont|doesnt|didnt|isnt|wasnt|arent|cant|wont|havent|hasnt)\b(?:\W+\w+){0,4}\W*$"
+)
+_NEGATION_AFTER = re.compile(
+    r"^(?:\W+\w+){0,4}?\W+(?:\w+n['’]t|not|no longer|anymore|any more|"
+    r"isnt|wasnt|arent|gone)\b"
+)
+
+# Clause boundaries that stop a negation from reaching the next phrase
+_CLAUSE_BREAK = re.compile(r"[.,;:!?]|\b(?:but|and|although|though|however)\b")
+
+# Trade hints in priority order; the first one present in the description wins
+TRADE_HINTS = (
+    ("outlet", "ELECTRICAL"),
+    ("wire", "ELECTRICAL"),
+    ("wiring", "ELECTRICAL"),
+    ("panel", "ELECTRICAL"),
+    ("breaker", "ELECTRICAL"),
+    ("spark", "ELECTRICAL"),
+    ("sparking", "ELECTRICAL"),
+    ("sparks", "ELECTRICAL"),
+    ("shocked", "ELECTRICAL"),
+    ("electricity", "ELECTRICAL"),
+    ("carbon monoxide", "HVAC"),
+    ("co alarm", "HVAC"),
+    ("co detector", "HVAC"),
+    ("furnace", "HVAC"),
+    ("boiler", "HVAC"),
+    ("stove", "APPLIANCE"),
+    ("oven", "APPLIANCE"),
+    ("dryer", "APPLIANCE"),
+    ("gas", "PLUMBING"),
+    ("water heater", "PLUMBING"),
+)
+
+_TRADE_PATTERNS = tuple(
+    (re.compile(rf"\b{re.escape(hint)}\b"), trade) for hint, trade in TRADE_HINTS
+)
+
+
+@dataclass(slots=True, frozen=True)
+class FastPathResult:
+    """Stand-in for the SDK RunResult when the fast path answers a request."""
+    final_output: str
+
+    def __str__(self) -> str:
+        return self.final_output
+
+
+def _description(request_data: Dict[str, Any]) -> str:
+    """Lowercased description from a request dict (nested or flat shape)."""
+    request = request_data.get("request") or request_data
+    description = request.get("description") if isinstance(request, dict) else None
+    return description.lower() if isinstance(description, str) else ""
+
+
+def _is_negated(description: str, start: int, end: int) -> bool:
+    """Whether the phrase at description[start:end] is negated within its clause."""
+    before = _CLAUSE_BREAK.split(description[:start])[-1]
+    after = _CLAUSE_BREAK.split(description[end:])[0]
+    return bool(_NEGATION_BEFORE.search(before) or _NEGATION_AFTER.search(after))
+
+
+def guess_trade(description: str) -> str:
+    """Pick the trade from the first matching hint in a lowercased description."""
+    for pattern, trade in _TRADE_PATTERNS:
+        if pattern.search(description):
+            return trade
+    return "GENERAL"
+
+
+def fast_path_triage(request_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Classify a request locally if it contains a mandatory-EMERGENCY phrase.
+
+    Args:
+        request_data: Dictionary containing the maintenance request and context.
+
+    Returns:
+        Triage output in the Triage Agent's JSON shape, or None when the
+        request needs the LLM.
+    """
+    description = _description(request_data)
+    matched: List[str] = []
+    for match in _EMERGENCY_PATTERN.finditer(description):
+        if _is_negated(description, match.start(), match.end()):
+            continue
+        if match.group(0) not in matched:
+            matched.append(match.group(0))
+    if not matched:
+        return None
+
+    return {
+        "severity": "EMERGENCY",
+        "trade": guess_trade(description),
+        "reasoning": (
+            "Fast path: the description contains mandatory-emergency "
+            f"keyword(s) ({', '.join(matched)})."
+        ),
+        "confidence": 0.99,
+        "key_factors": matched,
+    }
+
+
+def fast_path_result(triage_output: Dict[str, Any]) -> FastPathResult:
+    """Wrap a fast-path classification so callers can read final_output."""
+    return FastPathResult(final_output=json.dumps(triage_output, indent=2))
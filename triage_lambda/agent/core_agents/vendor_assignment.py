@@ -10,7 +10,7 @@ from dataclasses import dataclass
 import re
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VendorAssignmentResult:
     """Result of vendor assignment."""
     primary_vendor: Dict[str, Any]
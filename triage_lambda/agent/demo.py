@@ -1,32 +1,59 @@
 import asyncio
 import os
-import nest_asyncio
 from dotenv import load_dotenv
 import json
+import re
 import traceback
 from typing import Any, Dict, List, Optional, Union
-import pandas as pd
 
 load_dotenv()
 
-nest_asyncio.apply()
+from agents import Agent, ModelSettings, Runner, function_tool
+from openai.types.responses import ResponseTextDeltaEvent
 
-from openinference.instrumentation.openai_agents import OpenAIAgentsInstrumentor
-from langfuse import get_client
+import sys
 
+# Notebooks already run an event loop; allow re-entering it there only
+if "ipykernel" in sys.modules:
+    import nest_asyncio
+    nest_asyncio.apply()
 
-OpenAIAgentsInstrumentor().instrument()
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from agent.core_agents.base_agent import dumps_json, use_shared_openai_client
+from agent.core_agents.priority_calculator_agent import PriorityCalculatorAgent
+from agent.tracing import check_auth_in_background, configure_span_batching, flush_in_background
 
-try:
-    langfuse = get_client()
-    if langfuse.auth_check():
-        print("✅ Langfuse connected and tracing enabled.")
-    else:
-        print("❌ Langfuse authentication failed. Check your keys.")
-except Exception as e:
-    print(f"Warning: Could not verify Langfuse connection: {e}")
 
-from agents import Agent, Runner, function_tool
+# Langfuse client, set by _setup_tracing() once tracing is enabled
+langfuse = None
+_tracing_ready = False
+
+
+def _setup_tracing() -> Any:
+    """
+    Instrument the Agents SDK and create the Langfuse client, once per process.
+    
+    openinference and langfuse take seconds to import, so they are only loaded
+    when Langfuse credentials are configured instead of at module import.
+    
+    Returns:
+        The Langfuse client, or None when tracing is not configured.
+    """
+    global langfuse, _tracing_ready
+    if _tracing_ready or not os.environ.get("LANGFUSE_PUBLIC_KEY"):
+        return langfuse
+    _tracing_ready = True
+    
+    from openinference.instrumentation.openai_agents import OpenAIAgentsInstrumentor
+    from langfuse import get_client
+    
+    configure_span_batching()
+    OpenAIAgentsInstrumentor().instrument()
+    try:
+        langfuse = get_client()
+    except Exception as e:
+        print(f"Warning: Could not create Langfuse client: {e}")
+    return langfuse
 
 
 # ============================================================================
@@ -297,192 +324,113 @@ Respond with ONLY valid JSON. No preamble, explanation, or commentary outside JS
 """
 
 # Agent 1: Triage Classifier
+# prompt_cache_key routes calls to the provider's cache for the static system
+# prompt prefix; bump the version suffix whenever the prompt text changes.
+SYSTEM_PROMPT_AGENT_1_VERSION = "v1"
 triage_agent = Agent(
     name="Triage Classifier Agent",
     model="gpt-5-mini",
     instructions=SYSTEM_PROMPT_AGENT_1,
+    model_settings=ModelSettings(
+        extra_args={"prompt_cache_key": f"rentmatrix-triage-{SYSTEM_PROMPT_AGENT_1_VERSION}"}
+    ),
 )
 
 # ============================================================================
-# AGENT 2: PRIORITY CALCULATOR
+# AGENT 2: PRIORITY CALCULATOR (deterministic)
 # ============================================================================
-SYSTEM_PROMPT_AGENT_2 = """You are RentMatrix Priority Calculator, a specialized scoring engine for maintenance request urgency.
+# The priority score is a fixed formula over the triage output and the request
+# context, so it is computed locally instead of by a second LLM call.
+priority_calculator = PriorityCalculatorAgent(trace_enabled=True)
 
-# MISSION
-Calculate a numerical priority score (0-100) based on:
-1. Base severity classification (from Agent 1)
-2. Contextual modifiers (weather, tenant, property, history, timing)
-
-# PRIORITY SCORE FORMULA
-
-## BASE SCORES BY SEVERITY:
-- EMERGENCY: 85
-- HIGH: 60
-- MEDIUM: 30
-- LOW: 10
-
-## ADDITIVE MODIFIERS:
-
-### Safety/Health Keywords (+10 to +20):
-- Gas, carbon monoxide, CO alarm: +20
-- Fire, smoke, flames, burning smell: +18
-- Electrical shock, sparking, exposed wires: +15
-- Mold with health symptoms: +12
-- Sewage in living area: +15
-
-### Active Water Damage (+10 to +15):
-- "spreading", "getting worse": +15
-- "ceiling dripping": +12
-- "soaking through": +10
-- "water everywhere": +15
-
-### Time Sensitivity (+5 to +10):
-- After hours (6pm-8am): +5
-- Weekend: +3
-- Late night (10pm-6am): +7
-- Holiday: +5
-
-### Seasonal Urgency (+5 to +15):
-- No heat + winter (<40F outside): +15
-- No heat + cold (<50F outside): +10
-- No AC + extreme heat (>95F): +12
-- Frozen pipe risk + below 32F: +10
-- Water issue + freezing temps: +8
-
-### Tenant Impact (+5 to +15):
-- Infant (<2 years old): +10
-- Elderly (>75): +8
-- Medical condition mentioned: +12
-- Pregnant: +8
-- Multiple children: +5
-
-### Property Risk (+5 to +10):
-- Multi-unit building (affects multiple tenants): +8
-- Upper floor water leak (damage to below units): +10
-- Foundation/structural mention: +10
-- "extensive damage" mentioned: +7
-
-### Recurrence (+5 to +20):
-- "third time", "keeps happening": +15
-- "still not fixed": +12
-- "again": +8
-- "previous repair failed": +10
-
-### Loss of Essential Services (+10 to +20):
-- Cannot use kitchen: +12
-- Cannot use bathroom: +15
-- Cannot access unit safely: +18
-- No running water: +15
-- No toilet function: +12
-
-## SCORE CAPPING RULES:
-1. Never exceed 100
-2. Stay within severity category ranges:
-   - LOW: 0-29
-   - MEDIUM: 30-59
-   - HIGH: 60-84
-   - EMERGENCY: 85-100
-
-## OUTPUT FORMAT
-
-Respond with valid JSON only:
 
-{
-    "priority_score": <integer 0-100>,
-    "applied_modifiers": [
-        {
-            "category": "<modifier category>",
-            "points": <integer>,
-            "reason": "<brief explanation>"
-        }
-    ],
-    "base_score": <integer>,
-    "total_modifiers": <integer>,
-    "capped_at": <integer or null>
-}
-
-## EXAMPLES
-
-Example 1: EMERGENCY + Elderly + Winter
-Input: Severity=EMERGENCY, No heat, Outdoor=28F, Tenant=elderly
-Calculation:
-- Base: 85 (EMERGENCY)
-- Seasonal urgency (no heat + winter <40F): +15
-- Tenant impact (elderly): +8
-- Total: 85 + 23 = 108, cap at 100
-Output: priority_score = 100
-
-Example 2: MEDIUM + Recurring
-Input: Severity=MEDIUM, Slow leak, Third occurrence
-Calculation:
-- Base: 30 (MEDIUM)
-- Recurrence (third time): +15
-- Total: 30 + 15 = 45
-Output: priority_score = 45
-
-Example 3: LOW + No modifiers
-Input: Severity=LOW, Cosmetic paint issue
-Calculation:
-- Base: 10 (LOW)
-- No applicable modifiers: +0
-- Total: 10
-Output: priority_score = 10
-
-Now calculate the priority score for the given request.
-"""
-
-# Agent 2: Priority Calculator
-priority_agent = Agent(
-    name="Priority Calculator Agent",
-    model="gpt-5-mini",
-    instructions=SYSTEM_PROMPT_AGENT_2,
-)
-
-async def main():
-    prompt = """ this is the description of the request:
-    {
-      "test_id": "TC001",
-      "request": {
+REQUEST_DATA = {
+    "test_id": "TC001",
+    "request": {
         "request_id": "req-001",
         "description": "Strong gas smell in the basement near the water heater. Started about 20 minutes ago and getting stronger. Making my wife and kids feel dizzy and nauseous. We evacuated to the neighbors house. Can smell it from outside now. Please send someone IMMEDIATELY this is dangerous!",
         "images": [],
         "reported_at": "2024-12-09T23:30:00Z",
         "channel": "MOBILE"
-      },
-      "context": {
+    },
+    "context": {
         "weather": {
-          "temperature": 28,
-          "condition": "clear",
-          "forecast": "Clear overnight, low 25F",
-          "alerts": ["Winter Weather Advisory"]
+            "temperature": 28,
+            "condition": "clear",
+            "forecast": "Clear overnight, low 25F",
+            "alerts": ["Winter Weather Advisory"]
         },
         "tenant": {
-          "age": 35,
-          "is_elderly": false,
-          "has_infant": true,
-          "has_medical_condition": false,
-          "is_pregnant": false,
-          "occupant_count": 4,
-          "tenure_months": 18
+            "age": 35,
+            "is_elderly": False,
+            "has_infant": True,
+            "has_medical_condition": False,
+            "is_pregnant": False,
+            "occupant_count": 4,
+            "tenure_months": 18
         },
         "property": {
-          "type": "Single Family Home",
-          "age": 22,
-          "floor": null,
-          "total_units": 1,
-          "has_elevator": false
+            "type": "Single Family Home",
+            "age": 22,
+            "floor": None,
+            "total_units": 1,
+            "has_elevator": False
         },
         "timing": {
-          "day_of_week": "Monday",
-          "hour": 23,
-          "is_after_hours": true,
-          "is_weekend": false,
-          "is_holiday": false,
-          "is_late_night": true
+            "day_of_week": "Monday",
+            "hour": 23,
+            "is_after_hours": True,
+            "is_weekend": False,
+            "is_holiday": False,
+            "is_late_night": True
         }
-      }
     }
+}
+
+
+def parse_triage_output(text: str) -> Dict[str, Any]:
+    """Parse Agent 1's JSON output, tolerating a surrounding markdown fence."""
+    text = text.strip()
+    if text.startswith("```"):
+        text = text.strip("`")
+        if text.startswith("json"):
+            text = text[4:]
+    return json.loads(text)
+
+
+# Severity is emitted near the start of Agent 1's JSON, long before the reasoning
+SEVERITY_PATTERN = re.compile(r'"severity"\s*:\s*"(EMERGENCY|HIGH|MEDIUM|LOW)"')
+
+
+async def stream_triage(prompt: str) -> Any:
+    """
+    Run Agent 1 as a stream, reporting the severity as soon as it is generated.
+    
+    An EMERGENCY is visible after the first few tokens instead of after the
+    full classification has been decoded.
+    
+    Returns:
+        The completed streamed run (final_output holds the full JSON).
     """
+    result = Runner.run_streamed(triage_agent, input=prompt)
+    buffer = ""
+    severity = None
+    async for event in result.stream_events():
+        if event.type != "raw_response_event" or not isinstance(event.data, ResponseTextDeltaEvent):
+            continue
+        buffer += event.data.delta
+        if severity is None:
+            match = SEVERITY_PATTERN.search(buffer)
+            if match:
+                severity = match.group(1)
+                print(f"⚡ Severity detected while streaming: {severity}")
+    return result
+
+
+async def main():
+    auth_check = check_auth_in_background(_setup_tracing())
+    use_shared_openai_client()
+    prompt = f"this is the description of the request: {dumps_json(REQUEST_DATA)}"
     
     # =========================================================================
     # PIPELINE: Agent 1 (Triage) -> Agent 2 (Priority Calculator)
@@ -495,41 +443,36 @@ async def main():
     # Step 1: Run Agent 1 - Triage Classifier
     print("\n[STEP 1] Running Triage Classifier Agent...")
     print("-" * 40)
-    triage_result = await Runner.run(triage_agent, input=prompt)
+    triage_result = await stream_triage(prompt)
     
     print("\n✅ Agent 1 (Triage Classifier) Output:")
     print(triage_result.final_output)
     
-    # Step 2: Build input for Agent 2 using output from Agent 1
-    # The context from the original request is passed along with the triage result
-    agent2_prompt = f"""
-Based on the triage classification from Agent 1, calculate the priority score.
-
-## TRIAGE CLASSIFICATION (from Agent 1):
-{triage_result.final_output}
-
-## ORIGINAL REQUEST CONTEXT:
-{prompt}
-
-Calculate the priority score now using the base severity from the triage classification and apply all relevant modifiers based on the context provided.
-"""
-    
-    # Step 3: Run Agent 2 - Priority Calculator
+    # Step 2: Run Agent 2 - Priority Calculator on Agent 1's classification
+    # and the original request context (no LLM round trip)
     print("\n[STEP 2] Running Priority Calculator Agent...")
     print("-" * 40)
-    priority_result = await Runner.run(priority_agent, input=agent2_prompt)
+    triage_output = parse_triage_output(triage_result.final_output)
+    priority_result = priority_calculator.run(triage_output, REQUEST_DATA)
+    priority_output = json.dumps(priority_result.to_dict(), indent=2)
     
     print("\n✅ Agent 2 (Priority Calculator) Output:")
-    print(priority_result.final_output)
+    print(priority_output)
     
     # Summary
     print("\n" + "=" * 60)
     print("PIPELINE COMPLETE - FINAL SUMMARY")
     print("=" * 60)
     print(f"\n📋 Triage Result:\n{triage_result.final_output}")
-    print(f"\n📊 Priority Score:\n{priority_result.final_output}")
+    print(f"\n📊 Priority Score:\n{priority_output}")
 
-    langfuse.flush()
+    if auth_check is not None:
+        await auth_check
+    flush_in_background(langfuse)
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    try:
+        import uvloop  # optional; faster scheduling for the pipeline's many short awaits
+    except ImportError:  # not installed (or Windows): use the stdlib loop
+        uvloop = None
+    (uvloop.run if uvloop is not None else asyncio.run)(main())
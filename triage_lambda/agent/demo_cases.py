@@ -0,0 +1,181 @@
+"""
+Demo request fixtures shared by main.py and demo_complete.py.
+
+Each case is parsed once at import; "request" holds the compact prompt text
+and "parsed" the request dict.
+"""
+
+import json
+from types import MappingProxyType
+
+from .core_agents.base_agent import dumps_json
+
+
+# ============================================================================
+# TEST CASES
+# ============================================================================
+
+_CASE_SOURCES = (
+    {
+        "name": "EMERGENCY: Gas Leak with Evacuation",
+        "request": """
+this is the description of the request:
+{
+  "test_id": "TC001",
+  "request": {
+    "request_id": "req-001",
+    "description": "Strong gas smell in the basement near the water heater. Started about 20 minutes ago and getting stronger. Making my wife and kids feel dizzy and nauseous. We evacuated to the neighbors house. Can smell it from outside now. Please send someone IMMEDIATELY this is dangerous!",
+    "images": [],
+    "reported_at": "2024-12-09T23:30:00Z",
+    "channel": "MOBILE"
+  },
+  "context": {
+    "weather": {
+      "temperature": 28,
+      "condition": "clear",
+      "forecast": "Clear overnight, low 25F",
+      "alerts": ["Winter Weather Advisory"]
+    },
+    "tenant": {
+      "age": 35,
+      "is_elderly": false,
+      "has_infant": true,
+      "has_medical_condition": false,
+      "is_pregnant": false,
+      "occupant_count": 4,
+      "tenure_months": 18
+    },
+    "property": {
+      "type": "Single Family Home",
+      "age": 22,
+      "floor": null,
+      "total_units": 1,
+      "has_elevator": false
+    },
+    "timing": {
+      "day_of_week": "Monday",
+      "hour": 23,
+      "is_after_hours": true,
+      "is_weekend": false,
+      "is_holiday": false,
+      "is_late_night": true
+    }
+  }
+}
+"""
+    },
+    {
+        "name": "HIGH: Active Water Damage",
+        "request": """
+this is the description of the request:
+{
+  "test_id": "TC002",
+  "request": {
+    "request_id": "req-002",
+    "description": "Toilet overflowed about 30 minutes ago. Water is spreading to the bedroom now. I tried to stop it but can't. The floor is soaking wet and it's still leaking. This is getting worse!",
+    "images": ["image1.jpg", "image2.jpg"],
+    "reported_at": "2024-12-09T22:00:00Z",
+    "channel": "WEB"
+  },
+  "context": {
+    "weather": {
+      "temperature": 45,
+      "condition": "clear",
+      "forecast": "Clear",
+      "alerts": []
+    },
+    "tenant": {
+      "age": 78,
+      "is_elderly": true,
+      "has_infant": false,
+      "has_medical_condition": false,
+      "is_pregnant": false,
+      "occupant_count": 1,
+      "tenure_months": 36
+    },
+    "property": {
+      "type": "Apartment",
+      "age": 15,
+      "floor": 3,
+      "total_units": 20,
+      "has_elevator": true
+    },
+    "timing": {
+      "day_of_week": "Saturday",
+      "hour": 22,
+      "is_after_hours": true,
+      "is_weekend": true,
+      "is_holiday": false,
+      "is_late_night": false
+    }
+  }
+}
+"""
+    },
+    {
+        "name": "MEDIUM: Ambiguous Electrical Issue",
+        "request": """
+this is the description of the request:
+{
+  "test_id": "TC003",
+  "request": {
+    "request_id": "req-003",
+    "description": "One of the outlets in the kitchen isn't working. Might be making a slight buzzing sound, not sure. Other outlets seem fine. Not urgent but would like someone to check it out.",
+    "images": [],
+    "reported_at": "2024-12-09T14:00:00Z",
+    "channel": "EMAIL"
+  },
+  "context": {
+    "weather": {
+      "temperature": 72,
+      "condition": "sunny",
+      "forecast": "Clear and sunny",
+      "alerts": []
+    },
+    "tenant": {
+      "age": 32,
+      "is_elderly": false,
+      "has_infant": false,
+      "has_medical_condition": false,
+      "is_pregnant": false,
+      "occupant_count": 2,
+      "tenure_months": 12
+    },
+    "property": {
+      "type": "Apartment",
+      "age": 8,
+      "floor": 2,
+      "total_units": 50,
+      "has_elevator": true
+    },
+    "timing": {
+      "day_of_week": "Tuesday",
+      "hour": 14,
+      "is_after_hours": false,
+      "is_weekend": false,
+      "is_holiday": false,
+      "is_late_night": false
+    }
+  }
+}
+"""
+    },
+)
+
+# Parse every case once at import and send the compact rendering: the indented
+# blobs above spend their extra input tokens on whitespace. The cases are
+# read-only views so the shared fixtures cannot be modified by a caller.
+REQUEST_PREFIX = "this is the description of the request:"
+
+
+def _prepare(case):
+    """Return a read-only case with the compact request text and parsed dict."""
+    parsed = json.loads(case["request"].split(REQUEST_PREFIX, 1)[1])
+    return MappingProxyType({
+        "name": case["name"],
+        "request": f"{REQUEST_PREFIX} {dumps_json(parsed)}",
+        "parsed": parsed,
+    })
+
+
+TEST_CASES = tuple(_prepare(case) for case in _CASE_SOURCES)
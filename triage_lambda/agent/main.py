@@ -7,7 +7,6 @@ This script demonstrates the pipeline with a sample maintenance request.
 import asyncio
 import os
 import sys
-import nest_asyncio
 from dotenv import load_dotenv
 
 # Add parent directory to path for imports
@@ -16,97 +15,66 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 # Load environment variables
 load_dotenv()
 
-# Apply nest_asyncio for Jupyter/nested event loops
-nest_asyncio.apply()
+# Notebooks already run an event loop; allow re-entering it there only
+if "ipykernel" in sys.modules:
+    import nest_asyncio
+    nest_asyncio.apply()
 
 # Setup tracing
 from openinference.instrumentation.openai_agents import OpenAIAgentsInstrumentor
 from langfuse import get_client
+from agent.tracing import configure_span_batching
 
+configure_span_batching()
 OpenAIAgentsInstrumentor().instrument()
 
-# Verify Langfuse connection
+# The client is created here; its auth check runs in the background from the
+# entry coroutine (see check_auth_in_background)
 try:
     langfuse = get_client()
-    if langfuse.auth_check():
-        print("✅ Langfuse connected and tracing enabled.")
-    else:
-        print("❌ Langfuse authentication failed. Check your keys.")
 except Exception as e:
-    print(f"Warning: Could not verify Langfuse connection: {e}")
+    print(f"Warning: Could not create Langfuse client: {e}")
     langfuse = None
 
 # Import pipeline
 from agent.pipeline import TriagePipeline
+from agent.demo_cases import TEST_CASES
+from agent.tracing import check_auth_in_background, flush_in_background
 
 
-# Sample test data
-SAMPLE_REQUEST = """
-this is the description of the request:
-{
-  "test_id": "TC001",
-  "request": {
-    "request_id": "req-001",
-    "description": "Strong gas smell in the basement near the water heater. Started about 20 minutes ago and getting stronger. Making my wife and kids feel dizzy and nauseous. We evacuated to the neighbors house. Can smell it from outside now. Please send someone IMMEDIATELY this is dangerous!",
-    "images": [],
-    "reported_at": "2024-12-09T23:30:00Z",
-    "channel": "MOBILE"
-  },
-  "context": {
-    "weather": {
-      "temperature": 28,
-      "condition": "clear",
-      "forecast": "Clear overnight, low 25F",
-      "alerts": ["Winter Weather Advisory"]
-    },
-    "tenant": {
-      "age": 35,
-      "is_elderly": false,
-      "has_infant": true,
-      "has_medical_condition": false,
-      "is_pregnant": false,
-      "occupant_count": 4,
-      "tenure_months": 18
-    },
-    "property": {
-      "type": "Single Family Home",
-      "age": 22,
-      "floor": null,
-      "total_units": 1,
-      "has_elevator": false
-    },
-    "timing": {
-      "day_of_week": "Monday",
-      "hour": 23,
-      "is_after_hours": true,
-      "is_weekend": false,
-      "is_holiday": false,
-      "is_late_night": true
-    }
-  }
-}
-"""
+# Sample test data (the gas leak case shared with demo_complete.py)
+SAMPLE_REQUEST = TEST_CASES[0]["request"]
+SAMPLE_DATA = TEST_CASES[0]["parsed"]
+
+
+# Built once per process: repeated main() calls (and warm serverless
+# invocations importing this module) reuse its agents
+pipeline = TriagePipeline(
+    triage_model="gpt-5-mini",
+    priority_model="gpt-5-mini",
+    verbose=True
+)
 
 
 async def main():
     """Run the triage pipeline with sample data."""
-    
-    # Initialize pipeline
-    pipeline = TriagePipeline(
-        triage_model="gpt-5-mini",
-        priority_model="gpt-5-mini",
-        verbose=True
-    )
+    auth_check = check_auth_in_background(langfuse)
     
     # Run pipeline
-    result = await pipeline.run(SAMPLE_REQUEST)
+    result = await pipeline.run(SAMPLE_REQUEST, request_data=SAMPLE_DATA)
+    
+    if auth_check is not None:
+        await auth_check
     
-    # Flush Langfuse traces
-    if langfuse:
-        langfuse.flush()
+    # Flush Langfuse traces in the background (joined at exit)
+    flush_in_background(langfuse)
     
     return result
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop  # optional; faster scheduling for the pipeline's many short awaits
+    except ImportError:  # not installed (or Windows): use the stdlib loop
+        uvloop = None
+    (uvloop.run if uvloop is not None else asyncio.run)(main())
@@ -3,6 +3,7 @@ from .triage_prompt import SYSTEM_PROMPT_TRIAGE
 from .priority_prompt import SYSTEM_PROMPT_PRIORITY
 from .explainer_prompt import SYSTEM_PROMPT_EXPLAINER
 from .confidence_prompt import SYSTEM_PROMPT_CONFIDENCE
+from .explainer_confidence_prompt import SYSTEM_PROMPT_EXPLAINER_CONFIDENCE
 from .vendor_matching_prompt import SYSTEM_PROMPT_VENDOR_MATCHING
 from .vendor_explainer_prompt import SYSTEM_PROMPT_VENDOR_EXPLAINER
 
@@ -11,6 +12,7 @@ __all__ = [
     "SYSTEM_PROMPT_PRIORITY",
     "SYSTEM_PROMPT_EXPLAINER",
     "SYSTEM_PROMPT_CONFIDENCE",
+    "SYSTEM_PROMPT_EXPLAINER_CONFIDENCE",
     "SYSTEM_PROMPT_VENDOR_MATCHING",
     "SYSTEM_PROMPT_VENDOR_EXPLAINER"
 ]
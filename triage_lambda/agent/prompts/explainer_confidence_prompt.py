@@ -0,0 +1,60 @@
+"""
+System prompt for the fused Explainer + Confidence Evaluator Agent.
+Writes the PM/tenant explanations and the confidence assessment in one response.
+
+The guideline and scoring sections are taken from the Explainer and Confidence
+prompts, so edits to either are picked up here.
+"""
+
+from .explainer_prompt import SYSTEM_PROMPT_EXPLAINER
+from .confidence_prompt import SYSTEM_PROMPT_CONFIDENCE
+
+
+def _section(prompt: str, start: str, end: str) -> str:
+    """Return the part of a prompt from the start heading up to the end heading."""
+    return prompt[prompt.index(start):prompt.index(end)].strip()
+
+
+_EXPLAINER_GUIDELINES = _section(SYSTEM_PROMPT_EXPLAINER, "# GUIDELINES", "## INPUTS PROVIDED")
+_CONFIDENCE_FRAMEWORK = _section(
+    SYSTEM_PROMPT_CONFIDENCE, "# CONFIDENCE SCORING FRAMEWORK", "## OUTPUT FORMAT"
+)
+
+SYSTEM_PROMPT_EXPLAINER_CONFIDENCE = f"""You are RentMatrix Explainer and Confidence Evaluator. In one response you
+(1) write clear justifications of the triage decision for the property manager and the tenant, and
+(2) evaluate the confidence of the AI system's classification and prioritization.
+
+## INPUTS PROVIDED
+- TRIAGE_RESULT: JSON from Triage Agent (severity, trade, reasoning, confidence, key_factors)
+- PRIORITY_RESULT: JSON from Priority Agent (priority_score, factors, hazards, confidence)
+- ORIGINAL_REQUEST: The original user prompt/description
+
+# PART 1: EXPLANATIONS
+
+{_EXPLAINER_GUIDELINES}
+
+# PART 2: CONFIDENCE EVALUATION
+
+{_CONFIDENCE_FRAMEWORK}
+
+## OUTPUT FORMAT
+
+Respond with one valid JSON object only, containing both parts:
+
+{{
+    "pm_explanation": "<explanation for property manager>",
+    "tenant_explanation": "<explanation for tenant>",
+    "confidence": <float 0.30-1.0>,
+    "routing": "AUTO_APPROVE|PM_REVIEW_QUEUE|PM_IMMEDIATE_REVIEW",
+    "confidence_factors": [
+        {{
+            "factor": "<factor name>",
+            "impact": "POSITIVE|NEGATIVE",
+            "points": <float>,
+            "reason": "<brief explanation>"
+        }}
+    ],
+    "risk_flags": ["<flag1>", "<flag2>"],
+    "recommendation": "<Brief explanation of routing decision>"
+}}
+"""
@@ -229,6 +229,9 @@ Respond with ONLY valid JSON. No preamble, explanation, or commentary outside JS
     "<specific factor 3>"
   ]
 }
+
+**Multiple Requests:**
+If the input contains several requests marked [0], [1], ..., classify each one independently (never let one request influence another) and respond with ONLY {"results": [...]}: one object in the format above per request, in index order.
 ** Privde the final response in above format. NOTHING ELSE SHOULD BE PROVIDED.**
 **Confidence Guidelines:**
 - 0.95-1.0: Clear case, obvious classification, all info present
@@ -0,0 +1,100 @@
+"""
+Tracing helpers for the RentMatrix AI agents.
+Batches, verifies and flushes Langfuse without blocking the caller.
+"""
+
+import asyncio
+import atexit
+import os
+import threading
+import time
+from typing import Any, List, Optional
+
+
+# Longest time interpreter shutdown waits for background flushes to finish
+FLUSH_JOIN_TIMEOUT = float(os.getenv("LANGFUSE_FLUSH_TIMEOUT", "5"))
+
+# Span export batching. Langfuse exports through an OpenTelemetry
+# BatchSpanProcessor; these are its max_export_batch_size and schedule delay
+# (seconds), so a pipeline run's agent spans go out in one POST.
+SPAN_BATCH_SIZE = "512"
+SPAN_FLUSH_INTERVAL = "5"
+
+_FLUSH_THREADS: List[threading.Thread] = []
+
+
+def configure_span_batching() -> None:
+    """
+    Set the Langfuse span batching defaults.
+
+    Must be called before the Langfuse client is created (get_client()), which
+    reads LANGFUSE_FLUSH_AT and LANGFUSE_FLUSH_INTERVAL when it builds its span
+    processor. Values already set in the environment are kept.
+    """
+    os.environ.setdefault("LANGFUSE_FLUSH_AT", SPAN_BATCH_SIZE)
+    os.environ.setdefault("LANGFUSE_FLUSH_INTERVAL", SPAN_FLUSH_INTERVAL)
+
+
+def flush_in_background(client: Any) -> Optional[threading.Thread]:
+    """
+    Flush a Langfuse client on a daemon thread.
+
+    flush() blocks until every buffered trace event has been POSTed, which
+    would otherwise be paid at the end of each run. Short-lived processes still
+    deliver their traces: pending flushes are joined at exit (see
+    FLUSH_JOIN_TIMEOUT).
+
+    Args:
+        client: Langfuse client, or None when tracing is disabled.
+
+    Returns:
+        The started thread, or None if there was nothing to flush.
+    """
+    if client is None:
+        return None
+    thread = threading.Thread(target=client.flush, name="langfuse-flush", daemon=True)
+    thread.start()
+    _FLUSH_THREADS.append(thread)
+    return thread
+
+
+def check_auth_in_background(client: Any) -> Optional["asyncio.Task[Optional[bool]]"]:
+    """
+    Verify Langfuse credentials on a worker thread and log the outcome.
+
+    auth_check() is a blocking HTTP round trip; started from the entry
+    coroutine it overlaps with the pipeline's first LLM calls instead of
+    delaying startup. Must be called from a coroutine.
+
+    Args:
+        client: Langfuse client, or None when tracing is disabled.
+
+    Returns:
+        Task resolving to the auth result (None if the check failed to run),
+        or None if there is no client.
+    """
+    if client is None:
+        return None
+    return asyncio.create_task(_report_auth(client))
+
+
+async def _report_auth(client: Any) -> Optional[bool]:
+    """Run client.auth_check() off the event loop and print the result."""
+    try:
+        ok = await asyncio.to_thread(client.auth_check)
+    except Exception as e:
+        print(f"Warning: Could not verify Langfuse connection: {e}")
+        return None
+    if ok:
+        print("✅ Langfuse connected and tracing enabled.")
+    else:
+        print("❌ Langfuse authentication failed. Check your keys.")
+    return ok
+
+
+@atexit.register
+def _join_flush_threads() -> None:
+    """Give pending background flushes a bounded time to finish at exit."""
+    deadline = time.monotonic() + FLUSH_JOIN_TIMEOUT
+    for thread in _FLUSH_THREADS:
+        thread.join(timeout=max(0.0, deadline - time.monotonic()))
@@ -3,96 +3,291 @@ AWS Lambda Handler for RentMatrix AI Triage Engine
 Processes maintenance requests and returns triage analysis
 """
 
+import base64
+import hashlib
 import json
 import os
 import asyncio
-from typing import Dict, Any
+import time
+from collections import OrderedDict
+from operator import itemgetter
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
-import requests
+import httpx
 from dotenv import load_dotenv
-from dateutil import parser as date_parser
 
+from _helpers import convert_keys_to_camel, dumps_json, extract_result_text, parse_json_result
 from agent.core_agents.triage_agent import TriageAgent
 from agent.core_agents.priority_agent import PriorityAgent
 from agent.core_agents.explainer_agent import ExplainerAgent
-from agent.core_agents.confidence_agent import ConfidenceAgent
+from agent.core_agents.confidence_agent import ConfidenceAgent, CONF_SHORTCIRCUIT_MODE
+from agent.core_agents.explainer_confidence_agent import ExplainerConfidenceAgent
+from agent.core_agents.triage_fast_path import FastPathResult
 from agent.core_agents.sla_mapper_agent import SLAMapperAgent
 
 # Load environment variables
 load_dotenv()
 
-# Helper functions (from triage_processor.py)
-def extract_result_text(result):
-    """Extract text from RunResult object"""
-    if hasattr(result, 'data'):
-        return str(result.data)
-    elif hasattr(result, 'content'):
-        return str(result.content)
-    elif hasattr(result, 'text'):
-        return str(result.text)
-    else:
-        return str(result)
+# Agents are created once per container: warm invocations reuse them (and the
+# SDK Agent objects they build lazily) instead of rebuilding them per request
+triage_agent = TriageAgent()
+priority_agent = PriorityAgent()
+explainer_agent = ExplainerAgent()
+confidence_agent = ConfidenceAgent()
+explainer_confidence_agent = ExplainerConfidenceAgent()
+sla_mapper_agent = SLAMapperAgent()
 
+# The shared LLM response cache is opt-in; warm Lambda containers turn it on
+# (AGENT_RESPONSE_CACHE=false keeps it off). Entries expire after
+# AGENT_RESPONSE_CACHE_TTL seconds.
+if os.getenv("AGENT_RESPONSE_CACHE", "true").lower() in ("1", "true", "yes"):
+    for _agent in (triage_agent, priority_agent, explainer_agent, confidence_agent, explainer_confidence_agent):
+        _agent.cache_responses = True
 
-def parse_json_result(result_text, search_key="severity"):
-    """Parse JSON from result text with fallback regex"""
-    import re
-    try:
-        return json.loads(result_text)
-    except json.JSONDecodeError:
-        # Try to find JSON embedded in RunResult text
-        if 'Final output (str):' in result_text:
-            start_idx = result_text.find('Final output (str):') + len('Final output (str):')
-            remainder = result_text[start_idx:]
-            
-            json_start = remainder.find('{')
-            if json_start != -1:
-                brace_count = 0
-                json_end = -1
-                for i in range(json_start, len(remainder)):
-                    if remainder[i] == '{':
-                        brace_count += 1
-                    elif remainder[i] == '}':
-                        brace_count -= 1
-                        if brace_count == 0:
-                            json_end = i + 1
-                            break
-                
-                if json_end != -1:
-                    json_str = remainder[json_start:json_end]
-                    json_str = re.sub(r'\n\s+', ' ', json_str)
-                    try:
-                        return json.loads(json_str)
-                    except json.JSONDecodeError:
-                        pass
-        
-        json_match = re.search(r'\{[^{}]*"' + search_key + r'"[^{}]*\}', result_text, re.DOTALL)
-        if json_match:
-            return json.loads(json_match.group(0))
-        else:
-            return {"raw_output": result_text}
+# asyncio.run() would close its loop after every invocation, and pooled
+# connections belong to the loop that opened them, so warm invocations run on
+# one loop that lives as long as the container
+_loop = asyncio.new_event_loop()
 
+# Pooled keep-alive client for Auth0 and the backend, reused across invocations
+_http_client = httpx.AsyncClient(timeout=10)
 
-def snake_to_camel(snake_str):
-    """Convert snake_case to camelCase"""
-    components = snake_str.split('_')
-    return components[0] + ''.join(x.title() for x in components[1:])
+# Auth0 M2M tokens by (client_id, audience): (access_token, expires_at epoch)
+_TOKEN_CACHE: Dict[Tuple[str, str], Tuple[str, float]] = {}
 
+# Fetch a new token when the cached one expires within this many seconds
+TOKEN_REFRESH_MARGIN = 60
 
-def convert_keys_to_camel(obj):
-    """Recursively convert all dictionary keys from snake_case to camelCase"""
-    if isinstance(obj, dict):
-        return {snake_to_camel(k): convert_keys_to_camel(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_keys_to_camel(item) for item in obj]
-    else:
-        return obj
+# Completed triage results by request content (LRU). A repeat of a request
+# with the same description and context skips all four LLM calls; only the
+# SLA is recomputed for the new submission time. 0 disables the cache.
+# Entries are (expires_at monotonic time, dto) and expire after
+# TRIAGE_RESULT_CACHE_TTL seconds, so prompt or model changes roll out.
+RESULT_CACHE_SIZE = int(os.getenv("TRIAGE_RESULT_CACHE_SIZE", "128"))
+RESULT_CACHE_TTL = float(os.getenv("TRIAGE_RESULT_CACHE_TTL", "900"))
+_RESULT_CACHE: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+# Request fields that identify or timestamp a request without affecting its triage
+RESULT_CACHE_VOLATILE_FIELDS = frozenset({"requestId", "maintenanceId", "reportedAt"})
+
+# Write the explanations and the confidence evaluation with one LLM call
+# (they need the same inputs and not each other), saving a round trip
+FUSE_EXPLAINER_CONFIDENCE = os.getenv("FUSE_EXPLAINER_CONFIDENCE", "true").lower() in ("1", "true", "yes")
+
+# Print full incoming events (large maintenanceData blobs) only when debugging;
+# otherwise a one-line summary is logged and the event is not serialized
+LOG_EVENTS = os.getenv("LOG_EVENTS", "false").lower() in ("1", "true", "yes")
+
+# Return the dto with the agents' own snake_case keys, skipping the camelCase
+# formatting, for backends configured to accept snake_case
+SNAKE_CASE_RESPONSE = os.getenv("SNAKE_CASE_RESPONSE", "0") == "1"
+
+# Agent output fields used in the dto, with their defaults. Each output is
+# read in one pass: merged over its defaults, then picked with an itemgetter
+TRIAGE_DEFAULTS = {"severity": None, "trade": None, "reasoning": None, "confidence": 0, "key_factors": []}
+PRIORITY_DEFAULTS = {
+    "priority_score": 0, "severity": None, "base_hazard": 0, "combined_hazard": 0,
+    "applied_factors": [], "applied_interactions": [], "calculation_trace": None, "confidence": 0,
+}
+EXPLAINER_DEFAULTS = {"pm_explanation": None, "tenant_explanation": None}
+CONFIDENCE_DEFAULTS = {
+    "confidence": 0, "routing": None, "confidence_factors": [], "risk_flags": [], "recommendation": None,
+}
+_TRIAGE_FIELDS = itemgetter(*TRIAGE_DEFAULTS)
+_PRIORITY_FIELDS = itemgetter(*PRIORITY_DEFAULTS)
+_EXPLAINER_FIELDS = itemgetter(*EXPLAINER_DEFAULTS)
+_CONFIDENCE_FIELDS = itemgetter(*CONFIDENCE_DEFAULTS)
+
+BACKEND_URL = "https://3kiiv9aysj.execute-api.us-west-2.amazonaws.com/api/v1.0/maintenance/{maintenance_id}/triage"
+
+async def run_triage(maintenance_data: Dict[str, Any]):
+    """Run the Triage Agent; returns (raw_result, text, parsed_json)."""
+    triage_prompt = triage_agent.build_prompt(maintenance_data)
+    triage_result_raw = await triage_agent.run(
+        triage_prompt,
+        cache_key=triage_agent.cache_key(maintenance_data),
+        request_data=maintenance_data
+    )
+    triage_text = extract_result_text(triage_result_raw)
+    return triage_result_raw, triage_text, parse_json_result(triage_text, "severity")
+
+
+async def run_priority(triage_text: str, maintenance_data: Dict[str, Any]):
+    """Run the Priority Agent; returns (text, parsed_json)."""
+    priority_prompt = priority_agent.build_prompt(triage_text, maintenance_data)
+    priority_text = extract_result_text(await priority_agent.run(priority_prompt))
+    return priority_text, parse_json_result(priority_text, "priority_score")
+
+
+async def run_explainer(triage_text: str, priority_text: str, maintenance_data: Dict[str, Any]):
+    """Run the Explainer Agent; returns (text, parsed_json)."""
+    explainer_prompt = explainer_agent.build_prompt(triage_text, priority_text, maintenance_data)
+    explainer_text = extract_result_text(await explainer_agent.run(explainer_prompt))
+    return explainer_text, parse_json_result(explainer_text, "explanation")
+
+
+async def run_confidence(
+    triage_text: str,
+    priority_text: str,
+    explainer_text: str,
+    maintenance_data: Dict[str, Any],
+    triage_json: Dict[str, Any],
+    fast_path: bool
+) -> Dict[str, Any]:
+    """Run the Confidence Agent; returns its parsed JSON."""
+    confidence_prompt = confidence_agent.build_prompt(triage_text, priority_text, explainer_text, maintenance_data)
+    confidence_result_raw = await confidence_agent.run(
+        confidence_prompt,
+        triage_parsed=triage_json,
+        fast_path=fast_path
+    )
+    return parse_json_result(extract_result_text(confidence_result_raw), "confidence")
+
+
+async def run_explainer_and_confidence(
+    triage_text: str,
+    priority_text: str,
+    maintenance_data: Dict[str, Any],
+    triage_json: Dict[str, Any],
+    fast_path: bool
+):
+    """
+    Run the explanation and confidence stages; returns (explainer_json, confidence_json)
+    
+    Uses the fused Explainer + Confidence Agent unless fusing is disabled or
+    the confidence result is produced locally (unambiguous triage), in which
+    case the Explainer Agent runs alone and the Confidence Agent needs no LLM.
+    """
+    confidence_is_local = (
+        CONF_SHORTCIRCUIT_MODE == "on"
+        and confidence_agent.shortcut(triage_json, fast_path=fast_path) is not None
+    )
+    if FUSE_EXPLAINER_CONFIDENCE and not confidence_is_local:
+        fused_prompt = explainer_confidence_agent.build_prompt(triage_text, priority_text, maintenance_data)
+        fused_result = await explainer_confidence_agent.run(fused_prompt)
+        explainer_text, confidence_text = explainer_confidence_agent.split_output(
+            str(fused_result.final_output)
+        )
+        return (
+            parse_json_result(explainer_text, "explanation"),
+            parse_json_result(confidence_text, "confidence"),
+        )
+    
+    explainer_text, explainer_json = await run_explainer(triage_text, priority_text, maintenance_data)
+    confidence_json = await run_confidence(
+        triage_text, priority_text, explainer_text, maintenance_data, triage_json, fast_path
+    )
+    return explainer_json, confidence_json
+
+
+def run_sla(priority_score: int, submission_time: datetime) -> Dict[str, Any]:
+    """Run the SLA Mapper Agent (deterministic, no LLM); returns its dict."""
+    return sla_mapper_agent.run(priority_score, submission_time).to_dict()
+
+
+def sla_section(sla_mapper_json: Dict[str, Any]) -> Dict[str, Any]:
+    """Format the SLA Mapper output as the dto's sla section"""
+    if SNAKE_CASE_RESPONSE:
+        return sla_mapper_json
+    return {
+        "tier": sla_mapper_json.get("tier"),
+        "responseDeadline": sla_mapper_json.get("response_deadline"),
+        "resolutionDeadline": sla_mapper_json.get("resolution_deadline"),
+        "responseHours": sla_mapper_json.get("response_hours", 0),
+        "resolutionHours": sla_mapper_json.get("resolution_hours", 0),
+        "businessHoursOnly": sla_mapper_json.get("business_hours_only", False),
+        "vendorTier": sla_mapper_json.get("vendor_tier")
+    }
+
+
+def snake_case_dto(
+    triage_json: Dict[str, Any],
+    priority_json: Dict[str, Any],
+    explainer_json: Dict[str, Any],
+    confidence_json: Dict[str, Any],
+    sla_mapper_json: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Build the dto with the agents' snake_case keys (SNAKE_CASE_RESPONSE)"""
+    return {
+        "triage": dict(zip(TRIAGE_DEFAULTS, _TRIAGE_FIELDS({**TRIAGE_DEFAULTS, **triage_json}))),
+        "priority": dict(zip(PRIORITY_DEFAULTS, _PRIORITY_FIELDS({**PRIORITY_DEFAULTS, **priority_json}))),
+        "explanation": dict(zip(EXPLAINER_DEFAULTS, _EXPLAINER_FIELDS({**EXPLAINER_DEFAULTS, **explainer_json}))),
+        "confidence": dict(zip(CONFIDENCE_DEFAULTS, _CONFIDENCE_FIELDS({**CONFIDENCE_DEFAULTS, **confidence_json}))),
+        "sla": sla_mapper_json,
+        "weather": {
+            "temperature": 0,
+            "temperature_c": 0,
+            "feels_like_f": 0,
+            "feels_like_c": 0,
+            "condition": None,
+            "humidity": 0,
+            "wind_mph": 0,
+            "forecast": None,
+            "alerts": [],
+            "is_extreme_cold": False,
+            "is_extreme_heat": False,
+            "freeze_risk": False
+        }
+    }
+
+
+def remember_result(cache_key: str, dto: Dict[str, Any], parsed_outputs) -> None:
+    """Add a dto to the result cache unless an agent output failed to parse"""
+    if RESULT_CACHE_SIZE > 0 and not any("raw_output" in parsed for parsed in parsed_outputs):
+        _RESULT_CACHE[cache_key] = (time.monotonic() + RESULT_CACHE_TTL, dto)
+        _RESULT_CACHE.move_to_end(cache_key)
+        if len(_RESULT_CACHE) > RESULT_CACHE_SIZE:
+            _RESULT_CACHE.popitem(last=False)
+
+
+def cached_result(cache_key: str) -> Optional[Dict[str, Any]]:
+    """Return the cached dto for a key, dropping it once its TTL has passed"""
+    entry = _RESULT_CACHE.get(cache_key)
+    if entry is None:
+        return None
+    expires_at, dto = entry
+    if expires_at <= time.monotonic():
+        del _RESULT_CACHE[cache_key]
+        return None
+    _RESULT_CACHE.move_to_end(cache_key)
+    return dto
+
+
+def result_cache_key(maintenance_data: Dict[str, Any]) -> str:
+    """
+    Build the result cache key for a maintenance request
+    
+    Identifiers and timestamps are dropped and the description is normalized
+    (case and whitespace). The timing section is kept on purpose: late-night,
+    weekend and holiday flags change the priority score, so requests only
+    share an entry when they arrive in the same kind of time slot.
+    
+    Args:
+        maintenance_data: The maintenance request data from backend
+        
+    Returns:
+        Hex digest of the canonical request content
+    """
+    canonical = {k: v for k, v in maintenance_data.items() if k not in RESULT_CACHE_VOLATILE_FIELDS}
+    request = canonical.get("request")
+    if isinstance(request, dict):
+        request = {k: v for k, v in request.items() if k not in RESULT_CACHE_VOLATILE_FIELDS}
+        if isinstance(request.get("description"), str):
+            request["description"] = " ".join(request["description"].lower().split())
+        canonical["request"] = request
+    payload = json.dumps(canonical, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
 
 
 async def process_triage(maintenance_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Process maintenance request through all triage agents
     
+    Each agent starts as soon as its inputs are ready: triage -> priority ->
+    explainer/confidence is a true dependency chain (the last two share one
+    fused LLM call), while the SLA mapper only needs the priority score and
+    runs while that call is in flight.
+    
     Args:
         maintenance_data: The maintenance request data from backend
         
@@ -100,89 +295,93 @@ async def process_triage(maintenance_data: Dict[str, Any]) -> Dict[str, Any]:
         Complete triage analysis in dto format
     """
     
-    # Triage Agent
-    triage_agent = TriageAgent()
-    triage_prompt = triage_agent.build_prompt(maintenance_data)
-    triage_result_raw = await triage_agent.run(triage_prompt)
-    triage_text = extract_result_text(triage_result_raw)
-    triage_json = parse_json_result(triage_text, "severity")
+    # Get submission time from maintenance data or use current time
+    # (fromisoformat is C-implemented; "Z" is rewritten for older Pythons)
+    if maintenance_data.get("request", {}).get("reportedAt"):
+        submission_time = datetime.fromisoformat(
+            maintenance_data["request"]["reportedAt"].replace("Z", "+00:00")
+        )
+    else:
+        submission_time = datetime.utcnow()
     
-    # Priority Agent
-    priority_agent = PriorityAgent()
-    priority_prompt = priority_agent.build_prompt(triage_text, maintenance_data)
-    priority_result_raw = await priority_agent.run(priority_prompt)
-    priority_text = extract_result_text(priority_result_raw)
-    priority_json = parse_json_result(priority_text, "priority_score")
+    # Repeat request: reuse the agents' results, recompute only the SLA
+    cache_key = result_cache_key(maintenance_data)
+    cached = cached_result(cache_key)
+    if cached is not None:
+        dto = dict(cached)
+        priority_score = dto["priority"]["priority_score" if SNAKE_CASE_RESPONSE else "priorityScore"]
+        dto["sla"] = sla_section(run_sla(int(priority_score or 0), submission_time))
+        return {"dto": dto}
     
-    # Explainer Agent
-    explainer_agent = ExplainerAgent()
-    explainer_prompt = explainer_agent.build_prompt(triage_text, priority_text, maintenance_data)
-    explainer_result_raw = await explainer_agent.run(explainer_prompt)
-    explainer_text = extract_result_text(explainer_result_raw)
-    explainer_json = parse_json_result(explainer_text, "explanation")
+    # Triage Agent, then Priority Agent (needs the triage output)
+    triage_result_raw, triage_text, triage_json = await run_triage(maintenance_data)
+    priority_text, priority_json = await run_priority(triage_text, maintenance_data)
+    (
+        priority_score, priority_severity, base_hazard, combined_hazard,
+        applied_factors, applied_interactions, calculation_trace, priority_confidence
+    ) = _PRIORITY_FIELDS({**PRIORITY_DEFAULTS, **priority_json})
     
-    # Confidence Agent
-    confidence_agent = ConfidenceAgent()
-    confidence_prompt = confidence_agent.build_prompt(triage_text, priority_text, explainer_text, maintenance_data)
-    confidence_result_raw = await confidence_agent.run(confidence_prompt)
-    confidence_text = extract_result_text(confidence_result_raw)
-    confidence_json = parse_json_result(confidence_text, "confidence")
+    # Coerce the LLM's score before starting the background task, so a bad
+    # value raises here instead of leaving the task pending on the shared loop
+    sla_score = int(priority_score or 0)
     
-    # SLA Mapper Agent (deterministic, no LLM)
-    sla_mapper_agent = SLAMapperAgent()
-    priority_score = int(priority_json.get("priority_score", 0))
+    # Explainer and Confidence Agents in the background; SLA Mapper meanwhile
+    explain_task = asyncio.create_task(run_explainer_and_confidence(
+        triage_text, priority_text, maintenance_data,
+        triage_json, fast_path=isinstance(triage_result_raw, FastPathResult)
+    ))
+    sla_mapper_json = run_sla(sla_score, submission_time)
+    explainer_json, confidence_json = await explain_task
     
-    # Get submission time from maintenance data or use current time
-    from dateutil import parser as date_parser
-    if maintenance_data.get("request", {}).get("reportedAt"):
-        submission_time = date_parser.isoparse(maintenance_data["request"]["reportedAt"])
-    else:
-        submission_time = datetime.utcnow()
+    parsed_outputs = (triage_json, priority_json, explainer_json, confidence_json)
     
-    # Run SLA calculation (returns SLAResult object)
-    sla_result = sla_mapper_agent.run(priority_score, submission_time)
-    sla_mapper_json = sla_result.to_dict()
+    # snake_case backends take the agents' keys as they are
+    if SNAKE_CASE_RESPONSE:
+        dto = snake_case_dto(triage_json, priority_json, explainer_json, confidence_json, sla_mapper_json)
+        remember_result(cache_key, dto, parsed_outputs)
+        return {"dto": dto}
+    
+    # Read each agent's output fields once
+    severity, trade, reasoning, triage_confidence, key_factors = _TRIAGE_FIELDS(
+        {**TRIAGE_DEFAULTS, **triage_json}
+    )
+    pm_explanation, tenant_explanation = _EXPLAINER_FIELDS({**EXPLAINER_DEFAULTS, **explainer_json})
+    confidence, routing, confidence_factors, risk_flags, recommendation = _CONFIDENCE_FIELDS(
+        {**CONFIDENCE_DEFAULTS, **confidence_json}
+    )
     
     # Format final result
     final_result = {
         "dto": {
-            "triage": convert_keys_to_camel({
-                "severity": triage_json.get("severity"),
-                "trade": triage_json.get("trade"),
-                "reasoning": triage_json.get("reasoning"),
-                "confidence": triage_json.get("confidence", 0),
-                "key_factors": triage_json.get("key_factors", [])
-            }),
-            "priority": convert_keys_to_camel({
-                "priority_score": priority_json.get("priority_score", 0),
-                "severity": priority_json.get("severity"),
-                "base_hazard": priority_json.get("base_hazard", 0),
-                "combined_hazard": priority_json.get("combined_hazard", 0),
-                "applied_factors": priority_json.get("applied_factors", []),
-                "applied_interactions": priority_json.get("applied_interactions", []),
-                "calculation_trace": priority_json.get("calculation_trace"),
-                "confidence": priority_json.get("confidence", 0)
-            }),
-            "explanation": convert_keys_to_camel({
-                "pm_explanation": explainer_json.get("pm_explanation"),
-                "tenant_explanation": explainer_json.get("tenant_explanation")
-            }),
-            "confidence": convert_keys_to_camel({
-                "confidence": confidence_json.get("confidence", 0),
-                "routing": confidence_json.get("routing"),
-                "confidence_factors": confidence_json.get("confidence_factors", []),
-                "risk_flags": confidence_json.get("risk_flags", []),
-                "recommendation": confidence_json.get("recommendation")
-            }),
-            "sla": convert_keys_to_camel({
-                "tier": sla_mapper_json.get("tier"),
-                "response_deadline": sla_mapper_json.get("response_deadline"),
-                "resolution_deadline": sla_mapper_json.get("resolution_deadline"),
-                "response_hours": sla_mapper_json.get("response_hours", 0),
-                "resolution_hours": sla_mapper_json.get("resolution_hours", 0),
-                "business_hours_only": sla_mapper_json.get("business_hours_only", False),
-                "vendor_tier": sla_mapper_json.get("vendor_tier")
-            }),
+            "triage": {
+                "severity": severity,
+                "trade": trade,
+                "reasoning": reasoning,
+                "confidence": triage_confidence,
+                "keyFactors": convert_keys_to_camel(key_factors)
+            },
+            "priority": {
+                "priorityScore": priority_score,
+                "severity": priority_severity,
+                "baseHazard": base_hazard,
+                "combinedHazard": combined_hazard,
+                "appliedFactors": convert_keys_to_camel(applied_factors),
+                "appliedInteractions": convert_keys_to_camel(applied_interactions),
+                "calculationTrace": convert_keys_to_camel(calculation_trace),
+                "confidence": priority_confidence
+            },
+            "explanation": {
+                "pmExplanation": pm_explanation,
+                "tenantExplanation": tenant_explanation
+            },
+            "confidence": {
+                "confidence": confidence,
+                "routing": routing,
+                "confidenceFactors": convert_keys_to_camel(confidence_factors),
+                "riskFlags": convert_keys_to_camel(risk_flags),
+                "recommendation": recommendation
+            },
+            "sla": sla_section(sla_mapper_json),
             "weather": {
                 "temperature": 0,
                 "temperatureC": 0,
@@ -200,9 +399,84 @@ async def process_triage(maintenance_data: Dict[str, Any]) -> Dict[str, Any]:
         }
     }
     
+    remember_result(cache_key, final_result["dto"], parsed_outputs)
     return final_result
 
 
+def jwt_expiry(token: str) -> Optional[float]:
+    """Read the exp claim (epoch seconds) from a JWT without verifying it"""
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+async def get_access_token() -> str:
+    """
+    Get an Auth0 access token, reusing the cached one while it is valid
+    
+    M2M tokens live for hours, so warm invocations skip the token round trip.
+    
+    Returns:
+        Bearer token for the backend API
+    """
+    client_id = os.getenv("Auth0Management__ClientId")
+    audience = os.getenv("Auth0Management__Audience")
+    key = (client_id, audience)
+    
+    cached = _TOKEN_CACHE.get(key)
+    if cached and cached[1] - time.time() > TOKEN_REFRESH_MARGIN:
+        return cached[0]
+    
+    auth0_domain = os.getenv("Auth0Management__Domain")
+    token_payload = {
+        "client_id": client_id,
+        "client_secret": os.getenv("Auth0Management__ClientSecret"),
+        "audience": audience,
+        "grant_type": "client_credentials"
+    }
+    token_response = await _http_client.post(f"{auth0_domain}/oauth/token", json=token_payload)
+    token_response.raise_for_status()
+    token_json = token_response.json()
+    access_token = token_json["access_token"]
+    
+    # Prefer the token's own exp claim; fall back to expires_in from Auth0
+    expires_at = jwt_expiry(access_token)
+    if expires_at is None and token_json.get("expires_in"):
+        expires_at = time.time() + float(token_json["expires_in"])
+    if expires_at is not None:
+        _TOKEN_CACHE[key] = (access_token, expires_at)
+    return access_token
+
+
+async def fetch_maintenance(maintenance_id: str) -> Dict[str, Any]:
+    """
+    Fetch a maintenance request from the backend
+    
+    Args:
+        maintenance_id: ID of the maintenance request
+        
+    Returns:
+        The maintenance request data from backend
+    """
+    access_token = await get_access_token()
+    
+    # Fetch maintenance data
+    response = await _http_client.get(
+        BACKEND_URL.format(maintenance_id=maintenance_id),
+        headers={"Authorization": f"Bearer {access_token}"}
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+async def fetch_and_process(maintenance_id: str) -> Dict[str, Any]:
+    """Fetch a maintenance request and run it through the triage agents"""
+    return await process_triage(await fetch_maintenance(maintenance_id))
+
+
 def lambda_handler(event, context):
     """
     AWS Lambda handler function
@@ -216,57 +490,33 @@ def lambda_handler(event, context):
     """
     
     try:
-        print(f"Received event: {json.dumps(event)}")
+        if LOG_EVENTS:
+            print(f"Received event: {dumps_json(event)}")
+        else:
+            print(f"Received event: maintenanceId={event.get('maintenanceId')} "
+                  f"maintenanceData={'maintenanceData' in event}")
         
         # Check if maintenance data is provided directly
         if "maintenanceData" in event:
-            maintenance_data = event["maintenanceData"]
+            result = _loop.run_until_complete(process_triage(event["maintenanceData"]))
         elif "maintenanceId" in event:
-            # Fetch from backend
-            maintenance_id = event["maintenanceId"]
-            
-            # Get Auth0 token
-            auth0_domain = os.getenv("Auth0Management__Domain")
-            client_id = os.getenv("Auth0Management__ClientId")
-            client_secret = os.getenv("Auth0Management__ClientSecret")
-            audience = os.getenv("Auth0Management__Audience")
-            
-            token_url = f"{auth0_domain}/oauth/token"
-            token_payload = {
-                "client_id": client_id,
-                "client_secret": client_secret,
-                "audience": audience,
-                "grant_type": "client_credentials"
-            }
-            
-            token_response = requests.post(token_url, json=token_payload)
-            token_response.raise_for_status()
-            access_token = token_response.json()["access_token"]
-            
-            # Fetch maintenance data
-            backend_url = f"https://3kiiv9aysj.execute-api.us-west-2.amazonaws.com/api/v1.0/maintenance/{maintenance_id}/triage"
-            headers = {"Authorization": f"Bearer {access_token}"}
-            response = requests.get(backend_url, headers=headers)
-            response.raise_for_status()
-            maintenance_data = response.json()
+            # Fetch from backend, then process through triage pipeline
+            result = _loop.run_until_complete(fetch_and_process(event["maintenanceId"]))
         else:
             return {
                 "statusCode": 400,
-                "body": json.dumps({
+                "body": dumps_json({
                     "error": "Missing required field: maintenanceId or maintenanceData"
                 })
             }
         
-        # Process through triage pipeline
-        result = asyncio.run(process_triage(maintenance_data))
-        
         return {
             "statusCode": 200,
             "headers": {
                 "Content-Type": "application/json",
                 "Access-Control-Allow-Origin": "*"
             },
-            "body": json.dumps(result)
+            "body": dumps_json(result)
         }
         
     except Exception as e:
@@ -276,7 +526,7 @@ def lambda_handler(event, context):
         
         return {
             "statusCode": 500,
-            "body": json.dumps({
+            "body": dumps_json({
                 "error": "Internal server error",
                 "detail": str(e)
             })
@@ -5,11 +5,11 @@ import asyncio
 import sys
 from pathlib import Path
 import json
-import re
 
 # Add parent directory to path to import agent modules
 sys.path.append(str(Path(__file__).parent.parent))
 
+from _helpers import convert_keys_to_camel, extract_result_text, parse_json_result
 from agent.core_agents.triage_agent import TriageAgent
 from agent.core_agents.priority_agent import PriorityAgent
 from agent.core_agents.explainer_agent import ExplainerAgent
@@ -20,6 +20,13 @@ from agent.core_agents.sla_mapper_agent import SLAMapperAgent
 
 load_dotenv()
 
+# Agents are created once at import, as in lambda_handler.py
+triage_agent = TriageAgent()
+priority_agent = PriorityAgent()
+explainer_agent = ExplainerAgent()
+confidence_agent = ConfidenceAgent()
+sla_mapper_agent = SLAMapperAgent()
+
 # Configuration
 AUTH0_DOMAIN = os.getenv("Auth0Management__Domain")
 CLIENT_ID = os.getenv("Auth0Management__ClientId")
@@ -39,79 +46,6 @@ token_payload = {
     "grant_type": "client_credentials"
 }
 
-def extract_result_text(result):
-    """Extract text from RunResult object"""
-    if hasattr(result, 'data'):
-        return str(result.data)
-    elif hasattr(result, 'content'):
-        return str(result.content)
-    elif hasattr(result, 'text'):
-        return str(result.text)
-    else:
-        return str(result)
-
-
-def parse_json_result(result_text, search_key="severity"):
-    """Parse JSON from result text with fallback regex"""
-    try:
-        return json.loads(result_text)
-    except json.JSONDecodeError:
-        # Try to find JSON embedded in RunResult text
-        # Look for the pattern: Final output (str): followed by JSON
-        if 'Final output (str):' in result_text:
-            # Extract everything after "Final output (str):"
-            start_idx = result_text.find('Final output (str):') + len('Final output (str):')
-            remainder = result_text[start_idx:]
-            
-            # Find the JSON object - look for opening brace
-            json_start = remainder.find('{')
-            if json_start != -1:
-                # Extract from first { to the matching }
-                # Count braces to find the complete JSON
-                brace_count = 0
-                json_end = -1
-                for i in range(json_start, len(remainder)):
-                    if remainder[i] == '{':
-                        brace_count += 1
-                    elif remainder[i] == '}':
-                        brace_count -= 1
-                        if brace_count == 0:
-                            json_end = i + 1
-                            break
-                
-                if json_end != -1:
-                    json_str = remainder[json_start:json_end]
-                    # Clean up excessive whitespace and indentation
-                    json_str = re.sub(r'\n\s+', ' ', json_str)
-                    try:
-                        return json.loads(json_str)
-                    except json.JSONDecodeError:
-                        pass
-        
-        # Fallback: try to find any JSON with the search key
-        json_match = re.search(r'\{[^{}]*"' + search_key + r'"[^{}]*\}', result_text, re.DOTALL)
-        if json_match:
-            return json.loads(json_match.group(0))
-        else:
-            return {"raw_output": result_text}
-
-
-def snake_to_camel(snake_str):
-    """Convert snake_case to camelCase"""
-    components = snake_str.split('_')
-    return components[0] + ''.join(x.title() for x in components[1:])
-
-
-def convert_keys_to_camel(obj):
-    """Recursively convert all dictionary keys from snake_case to camelCase"""
-    if isinstance(obj, dict):
-        return {snake_to_camel(k): convert_keys_to_camel(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_keys_to_camel(item) for item in obj]
-    else:
-        return obj
-
-
 async def main():
     token_response = requests.post(token_url, json=token_payload)
     token_response.raise_for_status()
@@ -131,7 +65,6 @@ async def main():
     print("Processing with Triage Agent...")
     print("="*60 + "\n")
 
-    triage_agent = TriageAgent()
     prompt = triage_agent.build_prompt(response.json())
 
     # Run the agent
@@ -149,7 +82,6 @@ async def main():
     print("Processing with Priority Agent...")
     print("="*60 + "\n")
     
-    priority_agent = PriorityAgent()
     prompt = priority_agent.build_prompt(triage_text, response.json())
 
     # Run the agent
@@ -167,7 +99,6 @@ async def main():
     print("Processing with Explainer Agent...")
     print("="*60 + "\n")
     
-    explainer_agent = ExplainerAgent()
     prompt = explainer_agent.build_prompt(triage_text, priority_text, response.json())
     
     # Run the agent
@@ -185,7 +116,6 @@ async def main():
     print("Processing with Confidence Agent...")
     print("="*60 + "\n")
     
-    confidence_agent = ConfidenceAgent()
     prompt = confidence_agent.build_prompt(triage_text, priority_text, explainer_text, response.json())
     
     # Run the agent
@@ -203,14 +133,12 @@ async def main():
     print("Processing with SLA Mapper Agent...")
     print("="*60 + "\n")
     
-    sla_mapper_agent = SLAMapperAgent()
     priority_score = int(priority_json.get("priority_score", 0))
     
     # Get submission time from response data
     from datetime import datetime
-    from dateutil import parser as date_parser
     if response.json().get("request", {}).get("reportedAt"):
-        submission_time = date_parser.isoparse(response.json()["request"]["reportedAt"])
+        submission_time = datetime.fromisoformat(response.json()["request"]["reportedAt"].replace("Z", "+00:00"))
     else:
         submission_time = datetime.utcnow()
     
@@ -227,43 +155,43 @@ async def main():
     # Wrap in "dto" as required by backend
     final_result = {
         "dto": {
-            "triage": convert_keys_to_camel({
+            "triage": {
                 "severity": triage_json.get("severity"),
                 "trade": triage_json.get("trade"),
                 "reasoning": triage_json.get("reasoning"),
                 "confidence": triage_json.get("confidence", 0),
-                "key_factors": triage_json.get("key_factors", [])
-            }),
-            "priority": convert_keys_to_camel({
-                "priority_score": priority_json.get("priority_score", 0),
+                "keyFactors": convert_keys_to_camel(triage_json.get("key_factors", []))
+            },
+            "priority": {
+                "priorityScore": priority_json.get("priority_score", 0),
                 "severity": priority_json.get("severity"),
-                "base_hazard": priority_json.get("base_hazard", 0),
-                "combined_hazard": priority_json.get("combined_hazard", 0),
-                "applied_factors": priority_json.get("applied_factors", []),
-                "applied_interactions": priority_json.get("applied_interactions", []),
-                "calculation_trace": priority_json.get("calculation_trace"),
+                "baseHazard": priority_json.get("base_hazard", 0),
+                "combinedHazard": priority_json.get("combined_hazard", 0),
+                "appliedFactors": convert_keys_to_camel(priority_json.get("applied_factors", [])),
+                "appliedInteractions": convert_keys_to_camel(priority_json.get("applied_interactions", [])),
+                "calculationTrace": convert_keys_to_camel(priority_json.get("calculation_trace")),
                 "confidence": priority_json.get("confidence", 0)
-            }),
-            "explanation": convert_keys_to_camel({
-                "pm_explanation": explainer_json.get("pm_explanation"),
-                "tenant_explanation": explainer_json.get("tenant_explanation")
-            }),
-            "confidence": convert_keys_to_camel({
+            },
+            "explanation": {
+                "pmExplanation": explainer_json.get("pm_explanation"),
+                "tenantExplanation": explainer_json.get("tenant_explanation")
+            },
+            "confidence": {
                 "confidence": confidence_json.get("confidence", 0),
                 "routing": confidence_json.get("routing"),
-                "confidence_factors": confidence_json.get("confidence_factors", []),
-                "risk_flags": confidence_json.get("risk_flags", []),
+                "confidenceFactors": convert_keys_to_camel(confidence_json.get("confidence_factors", [])),
+                "riskFlags": convert_keys_to_camel(confidence_json.get("risk_flags", [])),
                 "recommendation": confidence_json.get("recommendation")
-            }),
-            "sla": convert_keys_to_camel({
+            },
+            "sla": {
                 "tier": sla_mapper_json.get("tier"),
-                "response_deadline": sla_mapper_json.get("response_deadline"),
-                "resolution_deadline": sla_mapper_json.get("resolution_deadline"),
-                "response_hours": sla_mapper_json.get("response_hours", 0),
-                "resolution_hours": sla_mapper_json.get("resolution_hours", 0),
-                "business_hours_only": sla_mapper_json.get("business_hours_only", False),
-                "vendor_tier": sla_mapper_json.get("vendor_tier")
-            }),
+                "responseDeadline": sla_mapper_json.get("response_deadline"),
+                "resolutionDeadline": sla_mapper_json.get("resolution_deadline"),
+                "responseHours": sla_mapper_json.get("response_hours", 0),
+                "resolutionHours": sla_mapper_json.get("resolution_hours", 0),
+                "businessHoursOnly": sla_mapper_json.get("business_hours_only", False),
+                "vendorTier": sla_mapper_json.get("vendor_tier")
+            },
             "weather": {
                 "temperature": 0,
                 "temperatureC": 0,